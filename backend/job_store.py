@@ -1026,48 +1026,51 @@ class JobStore:
                 "SELECT job_id, company_name, job_title, ats_score, ats_details "
                 "FROM jobs WHERE include_in_profile = 1 AND ats_details IS NOT NULL"
             )
-        rows = cursor.fetchall()
-        conn.close()
 
+        # Stream rows off the cursor rather than fetchall(): each row carries a
+        # full ats_details JSON blob and is only needed until it is decoded
         corpus_jobs = []
         skill_job_count: Counter = Counter()   # how many jobs required this skill
         skill_matched_count: Counter = Counter()  # how many jobs the CV matched it in
         job_titles: Counter = Counter()
 
-        for row in rows:
-            try:
-                details = json.loads(row["ats_details"])
-            except (json.JSONDecodeError, TypeError):
-                continue
+        try:
+            for row in cursor:
+                try:
+                    details = json.loads(row["ats_details"])
+                except (json.JSONDecodeError, TypeError):
+                    continue
 
-            corpus_jobs.append({
-                "job_id": row["job_id"],
-                "company_name": row["company_name"],
-                "job_title": row["job_title"],
-                "ats_score": row["ats_score"],
-            })
+                corpus_jobs.append({
+                    "job_id": row["job_id"],
+                    "company_name": row["company_name"],
+                    "job_title": row["job_title"],
+                    "ats_score": row["ats_score"],
+                })
 
-            if row["job_title"]:
-                job_titles[row["job_title"]] += 1
-
-            # All skills/keywords required by this JD
-            pe = details.get("parsed_entities", {})
-            jd_skills: set = set()
-            for s in pe.get("jd_required_skills", []):
-                jd_skills.add(s.lower().strip())
-            for s in pe.get("jd_preferred_skills", []):
-                jd_skills.add(s.lower().strip())
-            # Also include all keywords the ATS tested (matched + missing)
-            matched_kws = {k.lower().strip() for k in details.get("matched_keywords", [])}
-            missing_kws = {k.lower().strip() for k in details.get("missing_keywords", [])}
-            all_jd_terms = jd_skills | matched_kws | missing_kws
-
-            for skill in all_jd_terms:
-                if skill:
-                    skill_job_count[skill] += 1
-            for skill in matched_kws:
-                if skill in all_jd_terms:
-                    skill_matched_count[skill] += 1
+                if row["job_title"]:
+                    job_titles[row["job_title"]] += 1
+
+                # All skills/keywords required by this JD
+                pe = details.get("parsed_entities", {})
+                jd_skills: set = set()
+                for s in pe.get("jd_required_skills", []):
+                    jd_skills.add(s.lower().strip())
+                for s in pe.get("jd_preferred_skills", []):
+                    jd_skills.add(s.lower().strip())
+                # Also include all keywords the ATS tested (matched + missing)
+                matched_kws = {k.lower().strip() for k in details.get("matched_keywords", [])}
+                missing_kws = {k.lower().strip() for k in details.get("missing_keywords", [])}
+                all_jd_terms = jd_skills | matched_kws | missing_kws
+
+                for skill in all_jd_terms:
+                    if skill:
+                        skill_job_count[skill] += 1
+                for skill in matched_kws:
+                    if skill in all_jd_terms:
+                        skill_matched_count[skill] += 1
+        finally:
+            conn.close()
 
         total_jobs = len(corpus_jobs)
         if total_jobs == 0:
@@ -54,7 +54,7 @@ if docx_file.exists():
     with open(docx_file, 'r', encoding='utf-8') as f:
         docx_content = f.read()
     
-    if "output_path_escaped" in docx_content:
+    if "json.dumps(" in docx_content:
         print(f"  ✓ Windows path escaping is present")
     else:
         print(f"  ✗ Windows path escaping MISSING - DOCX generation will fail!")
@@ -81,7 +81,7 @@ if workflow_file.exists() and docx_file.exists():
         print("   Replace it with the updated version provided.")
         needs_update = True
     
-    if "output_path_escaped" not in docx_content:
+    if "json.dumps(" not in docx_content:
         print("\n⚠️  Your src/docx_templates.py needs the Windows path fix!")
         print("   Replace it with the fixed version provided.")
         needs_update = True
@@ -1,4 +1,4 @@
-import { useEffect, useRef, useState } from 'react';
+import { useDeferredValue, useEffect, useRef, useState } from 'react';
 import {
   FileText,
   Search,
@@ -64,11 +64,15 @@ function ApplicationHistory() {
 
   const backends = Array.from(new Set((applications || []).map(a => a.backend)));
 
+  // Filter on a deferred copy of the query so fast typing keeps the input
+  // responsive and the table re-filters once the keystrokes settle
+  const deferredSearchQuery = useDeferredValue(searchQuery);
+  const query = deferredSearchQuery.toLowerCase();
   const filteredApplications = (applications || [])
     .filter(app => {
       const matchesSearch =
-        app.job_name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        (app.company_name?.toLowerCase().includes(searchQuery.toLowerCase()) ?? false);
+        app.job_name.toLowerCase().includes(query) ||
+        (app.company_name?.toLowerCase().includes(query) ?? false);
       const matchesBackend = backendFilter === 'all' || app.backend === backendFilter;
       const matchesStatus = statusFilter === 'all' || app.outcome_status === statusFilter;
       return matchesSearch && matchesBackend && matchesStatus;
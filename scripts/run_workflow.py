@@ -12,7 +12,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import argparse
 import os
-from job_application_workflow import JobApplicationWorkflow
 
 
 def main():
@@ -108,10 +107,9 @@ Examples:
     custom_questions = None
     if args.questions:
         questions_path = Path(args.questions)
-        if questions_path.exists():
-            with open(questions_path, 'r') as f:
-                custom_questions = f.read()
-        else:
+        try:
+            custom_questions = questions_path.read_text()
+        except FileNotFoundError:
             print(f"⚠️  Warning: Questions file not found: {questions_path}")
     
     # Build backend configuration
@@ -138,6 +136,10 @@ Examples:
             'requests_per_minute': args.gemini_rpm
         }
     
+    # Imported lazily: the workflow pulls in the LLM clients and parsers, which
+    # --help and the validation errors above don't need
+    from job_application_workflow import JobApplicationWorkflow
+
     # Initialize workflow
     try:
         workflow = JobApplicationWorkflow(
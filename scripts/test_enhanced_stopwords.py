@@ -64,13 +64,15 @@ def test_stopwords_comparison():
     print("COMPARISON RESULTS")
     print("="*70)
     
-    # Get top keywords from both
-    top_without = dict(keywords_without.most_common(15))
-    top_with = dict(keywords_with.most_common(15))
+    # Get top keywords from both (computed once, reused for the tables below)
+    top_without_items = keywords_without.most_common(15)
+    top_with_items = keywords_with.most_common(15)
+    top_without = dict(top_without_items)
+    top_with = dict(top_with_items)
     
     print("\n📊 WITHOUT Company Name Filtering:")
     print("-" * 70)
-    for i, (keyword, count) in enumerate(keywords_without.most_common(15), 1):
+    for i, (keyword, count) in enumerate(top_without_items, 1):
         # Highlight noise words
         if keyword in ['citi', 'apply', 'save', 'job', 'click', 'view', 'your']:
             print(f"  {i:2}. {keyword:20} ({count:2}) ⚠️  NOISE WORD")
@@ -79,7 +81,7 @@ def test_stopwords_comparison():
     
     print("\n📊 WITH Company Name Filtering (Enhanced):")
     print("-" * 70)
-    for i, (keyword, count) in enumerate(keywords_with.most_common(15), 1):
+    for i, (keyword, count) in enumerate(top_with_items, 1):
         print(f"  {i:2}. {keyword:20} ({count:2}) ✅")
     
     # Calculate improvement
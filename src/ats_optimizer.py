@@ -7,17 +7,338 @@ Features: N-gram extraction, synonym matching, weighted scoring, LLM integration
           Semantic similarity scoring (Track 2.8.2)
 """
 
+import copy
+import hashlib
 import re
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Optional
 from llm_backend import LLMBackend
 from document_parser import (
     DocumentParser, ParsedCV, ParsedJD,
-    CVSectionType, JDSectionType, EntityType, Entity
+    CVSectionType, JDSectionType, Entity
 )
 from semantic_scorer import SemanticScorer, SemanticScoreResult
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+# Base ATS stopwords (articles, prepositions, common verbs)
+_BASE_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'us', 'them', 'what', 'which', 'who', 'when', 'where', 'why', 'how',
+    'all', 'each', 'every', 'both', 'few', 'more', 'most', 'some', 'such',
+    'into', 'through', 'above', 'below', 'between', 'under', 'over',
+    'out', 'up', 'down', 'off', 'then', 'than', 'so', 'just', 'also',
+    'very', 'too', 'any', 'only', 'own', 'same', 'no', 'not', 'now'
+})
+
+# Job posting UI/navigation words (common across job sites)
+_UI_STOPWORDS = frozenset({
+    'apply', 'job', 'save', 'show', 'view', 'click', 'here', 'read',
+    'more', 'less', 'back', 'next', 'previous', 'search', 'filter',
+    'sort', 'share', 'print', 'email', 'download', 'upload', 'submit',
+    'send', 'post', 'date', 'ago', 'day', 'week', 'month', 'year',
+    'new', 'updated', 'end', 'start', 'while', 'during', 'about',
+    'our', 'your', 'their', 'its', 'my', 'we', 'us'
+})
+
+# Job posting boilerplate words (appear in most job postings)
+_JOB_POSTING_STOPWORDS = frozenset({
+    'responsibilities', 'responsibility', 'requirements', 'requirement',
+    'qualifications', 'qualification', 'preferred', 'required', 'must',
+    'candidate', 'candidates', 'position', 'role', 'opportunity',
+    'looking', 'seeking', 'hiring', 'join', 'team', 'company',
+    'ideal', 'strong', 'excellent', 'good', 'great', 'best',
+    'ability', 'able', 'skills', 'skill', 'experience', 'experienced',
+    'knowledge', 'understanding', 'familiar', 'familiarity',
+    'work', 'working', 'environment', 'based', 'including', 'includes',
+    'well', 'within', 'across', 'using', 'used', 'use',
+    'ensure', 'ensuring', 'provide', 'providing', 'support', 'supporting',
+    'develop', 'developing', 'development', 'create', 'creating',
+    'manage', 'managing', 'management', 'lead', 'leading',
+    'build', 'building', 'design', 'designing', 'implement', 'implementing',
+    'etc', 'other', 'others', 'various', 'multiple', 'different',
+    'minimum', 'maximum', 'least', 'plus', 'years', 'year',
+    'full', 'time', 'part', 'remote', 'onsite', 'hybrid', 'office',
+    'salary', 'benefits', 'compensation', 'package', 'competitive',
+    'equal', 'employer', 'employment', 'applicants', 'applicant'
+})
+
+# Common tech abbreviation mappings (abbreviation -> full forms)
+_ABBREVIATION_MAP = MappingProxyType({
+    'js': ('javascript',),
+    'ts': ('typescript',),
+    'py': ('python',),
+    'rb': ('ruby',),
+    'ml': ('machine learning',),
+    'ai': ('artificial intelligence',),
+    'dl': ('deep learning',),
+    'nlp': ('natural language processing',),
+    'cv': ('computer vision',),
+    'aws': ('amazon web services',),
+    'gcp': ('google cloud platform', 'google cloud'),
+    'azure': ('microsoft azure',),
+    'k8s': ('kubernetes',),
+    'docker': ('containerization', 'containers'),
+    'ci': ('continuous integration',),
+    'cd': ('continuous deployment', 'continuous delivery'),
+    'cicd': ('ci/cd', 'continuous integration', 'continuous deployment'),
+    'api': ('apis', 'rest api', 'restful'),
+    'sql': ('mysql', 'postgresql', 'database'),
+    'nosql': ('mongodb', 'dynamodb', 'non-relational'),
+    'db': ('database', 'databases'),
+    'ui': ('user interface',),
+    'ux': ('user experience',),
+    'qa': ('quality assurance', 'testing'),
+    'pm': ('project management', 'product management'),
+    'scrum': ('agile', 'sprint'),
+    'agile': ('scrum', 'kanban', 'sprint'),
+    'oop': ('object oriented programming', 'object-oriented'),
+    'fp': ('functional programming',),
+    'tdd': ('test driven development', 'test-driven'),
+    'bdd': ('behavior driven development',),
+    'saas': ('software as a service',),
+    'paas': ('platform as a service',),
+    'iaas': ('infrastructure as a service',),
+    'rest': ('restful', 'rest api'),
+    'graphql': ('graph ql',),
+    'react': ('reactjs', 'react.js'),
+    'vue': ('vuejs', 'vue.js'),
+    'angular': ('angularjs', 'angular.js'),
+    'node': ('nodejs', 'node.js'),
+    'express': ('expressjs', 'express.js'),
+    'django': ('python django',),
+    'flask': ('python flask',),
+    'spring': ('spring boot', 'spring framework'),
+    'dotnet': ('.net', 'dot net', 'asp.net'),
+    'tf': ('tensorflow',),
+    'pytorch': ('torch',),
+    'pandas': ('data analysis',),
+    'numpy': ('numerical python',),
+    'git': ('github', 'gitlab', 'version control'),
+    'linux': ('unix', 'ubuntu', 'centos', 'redhat'),
+    'bash': ('shell', 'shell scripting'),
+    'powershell': ('windows scripting',),
+    'html': ('html5',),
+    'css': ('css3', 'styling'),
+    'sass': ('scss',),
+    'jwt': ('json web token', 'authentication'),
+    'oauth': ('oauth2', 'authentication'),
+    'sso': ('single sign-on',),
+    'sdk': ('software development kit',),
+    'ide': ('integrated development environment',),
+    'vscode': ('visual studio code',),
+    'jira': ('atlassian', 'issue tracking'),
+    'confluence': ('atlassian', 'documentation'),
+    'slack': ('team communication',),
+    'etl': ('extract transform load', 'data pipeline'),
+    'bi': ('business intelligence',),
+    'kpi': ('key performance indicator', 'metrics'),
+    'roi': ('return on investment',),
+    'b2b': ('business to business',),
+    'b2c': ('business to consumer',),
+    'crm': ('customer relationship management', 'salesforce'),
+    'erp': ('enterprise resource planning',),
+    'hr': ('human resources',),
+    'devops': ('dev ops', 'development operations'),
+    'sre': ('site reliability engineering', 'site reliability'),
+    'sla': ('service level agreement',),
+    'cdn': ('content delivery network',),
+    'dns': ('domain name system',),
+    'ssl': ('tls', 'https', 'security'),
+    'vpc': ('virtual private cloud',),
+    'ec2': ('elastic compute', 'aws compute'),
+    's3': ('aws storage', 'object storage'),
+    'rds': ('relational database service',),
+    'lambda': ('serverless', 'aws lambda'),
+})
+
+# Role/title suffix variations (manager <-> management, etc.)
+_ROLE_VARIATIONS = MappingProxyType({
+    'manager': ('management', 'managing'),
+    'management': ('manager', 'managing'),
+    'engineer': ('engineering',),
+    'engineering': ('engineer',),
+    'developer': ('development', 'developing'),
+    'development': ('developer', 'developing'),
+    'analyst': ('analysis', 'analytics', 'analyzing'),
+    'analysis': ('analyst', 'analytics'),
+    'analytics': ('analyst', 'analysis'),
+    'architect': ('architecture', 'architecting'),
+    'architecture': ('architect',),
+    'administrator': ('administration', 'admin'),
+    'administration': ('administrator', 'admin'),
+    'admin': ('administrator', 'administration'),
+    'consultant': ('consulting', 'consultancy'),
+    'consulting': ('consultant', 'consultancy'),
+    'director': ('directing', 'directorship'),
+    'lead': ('leader', 'leading', 'leadership'),
+    'leader': ('lead', 'leading', 'leadership'),
+    'leadership': ('lead', 'leader', 'leading'),
+    'coordinator': ('coordination', 'coordinating'),
+    'coordination': ('coordinator', 'coordinating'),
+    'specialist': ('specialization', 'specialized'),
+    'supervisor': ('supervision', 'supervising'),
+    'programme': ('program', 'programs', 'programmes'),
+    'program': ('programme', 'programs', 'programmes'),
+    'project': ('projects',),
+    'projects': ('project',),
+})
+
+def _build_reverse_abbreviation_map() -> MappingProxyType:
+    """Reverse mapping (full form -> abbreviations)."""
+    reverse_abbreviations = defaultdict(list)
+    for abbr, full_forms in _ABBREVIATION_MAP.items():
+        for full_form in full_forms:
+            reverse_abbreviations[full_form].append(abbr)
+    return MappingProxyType({
+        full_form: tuple(abbrs) for full_form, abbrs in reverse_abbreviations.items()
+    })
+
+
+_REVERSE_ABBREVIATION_MAP = _build_reverse_abbreviation_map()
+
+
+def _build_synonyms() -> MappingProxyType:
+    """Merge abbreviations, full forms and role variations so expanding a
+    keyword is a single lookup."""
+    synonyms = {}
+    for mapping in (_ABBREVIATION_MAP, _REVERSE_ABBREVIATION_MAP, _ROLE_VARIATIONS):
+        for key, values in mapping.items():
+            synonyms.setdefault(key, set()).update(values)
+    return MappingProxyType({key: frozenset(values) for key, values in synonyms.items()})
+
+
+_SYNONYMS = _build_synonyms()
+
+
+# SemanticScorer holds the embedding model (and DocumentParser is stateless), so
+# one of each is shared by every ATSOptimizer.
+_shared_components_lock = threading.Lock()
+_shared_document_parser: Optional[DocumentParser] = None
+_shared_semantic_scorer: Optional[SemanticScorer] = None
+
+
+def _get_document_parser() -> DocumentParser:
+    """Return the process-wide DocumentParser, creating it on first use."""
+    global _shared_document_parser
+    with _shared_components_lock:
+        if _shared_document_parser is None:
+            _shared_document_parser = DocumentParser()
+        return _shared_document_parser
+
+
+def _get_semantic_scorer() -> SemanticScorer:
+    """Return the process-wide SemanticScorer, creating it on first use."""
+    global _shared_semantic_scorer
+    with _shared_components_lock:
+        if _shared_semantic_scorer is None:
+            _shared_semantic_scorer = SemanticScorer()
+        return _shared_semantic_scorer
+
+
+class RequirementsCache:
+    """
+    Bounded LRU cache of LLM requirement extractions, shared across optimizers.
+
+    Exact repeats of a job description hit on the text itself. Near-duplicates
+    (reposts, reformatted copies) hit when the cosine similarity of their
+    document embeddings reaches ``threshold``. Entries are keyed by backend
+    name so a different model never serves another model's output.
+    """
+
+    def __init__(self, maxsize: int = 256, threshold: float = 0.97):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        # (backend_name, text) -> (unit-norm embedding or None, requirements)
+        self._entries: OrderedDict[tuple[str, str], tuple[Any, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_exact(self, backend_name: str, text: str) -> Optional[str]:
+        """Return cached requirements for this exact text, if any."""
+        key = (backend_name, text.strip())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_similar(self, backend_name: str, embedding: Any) -> Optional[str]:
+        """Return requirements of the most similar cached text above threshold."""
+        if embedding is None or np is None:
+            return None
+        norm = np.linalg.norm(embedding)
+        if norm == 0:
+            return None
+
+        with self._lock:
+            keys = [k for k, (emb, _) in self._entries.items()
+                    if k[0] == backend_name and emb is not None]
+            if not keys:
+                return None
+            matrix = np.stack([self._entries[k][0] for k in keys])
+            similarities = matrix @ (embedding / norm)
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            self._entries.move_to_end(keys[best])
+            return self._entries[keys[best]][1]
+
+    def put(self, backend_name: str, text: str, embedding: Any, requirements: str) -> None:
+        """Cache requirements for a text, evicting the least recently used entry."""
+        if embedding is not None and np is not None:
+            norm = np.linalg.norm(embedding)
+            embedding = embedding / norm if norm else None
+        key = (backend_name, text.strip())
+        with self._lock:
+            self._entries[key] = (embedding, requirements)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class ATSOptimizer:
+    # Shared by all instances: the backend builds a new optimizer per request,
+    # and re-scoring the same job should not pay for another LLM round-trip
+    _requirements_cache = RequirementsCache()
+
+    # extract_keywords results keyed by (text digest, stopword set); including
+    # the stopwords means a company change can never serve stale keywords
+    _keywords_cache: OrderedDict = OrderedDict()
+    _keywords_cache_lock = threading.Lock()
+    _KEYWORDS_CACHE_SIZE = 64
+
+    # calculate_ats_score results, keyed the same way on all three input texts
+    _score_cache: OrderedDict = OrderedDict()
+    _score_cache_lock = threading.Lock()
+    _SCORE_CACHE_SIZE = 32
+
+    # DocumentParser results keyed by (document kind, text digest), so a CV
+    # scored against several jobs (or a job against CV revisions) is parsed once
+    _parsed_cache: OrderedDict = OrderedDict()
+    _parsed_cache_lock = threading.Lock()
+    _PARSED_CACHE_SIZE = 32
+
     def __init__(self, backend: LLMBackend = None, model_name: str = None, company_name: str = None):
         """
         Initialize with an LLM backend
@@ -31,191 +352,25 @@ class ATSOptimizer:
         self.model_name = model_name  # Store for legacy compatibility
         self.company_name = company_name
 
-        # Base ATS stopwords (articles, prepositions, common verbs)
-        self.base_stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-            'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this',
-            'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'us', 'them', 'what', 'which', 'who', 'when', 'where', 'why', 'how',
-            'all', 'each', 'every', 'both', 'few', 'more', 'most', 'some', 'such',
-            'into', 'through', 'above', 'below', 'between', 'under', 'over',
-            'out', 'up', 'down', 'off', 'then', 'than', 'so', 'just', 'also',
-            'very', 'too', 'any', 'only', 'own', 'same', 'no', 'not', 'now'
-        }
-
-        # Job posting UI/navigation words (common across job sites)
-        self.ui_stopwords = {
-            'apply', 'job', 'save', 'show', 'view', 'click', 'here', 'read',
-            'more', 'less', 'back', 'next', 'previous', 'search', 'filter',
-            'sort', 'share', 'print', 'email', 'download', 'upload', 'submit',
-            'send', 'post', 'date', 'ago', 'day', 'week', 'month', 'year',
-            'new', 'updated', 'end', 'start', 'while', 'during', 'about',
-            'our', 'your', 'their', 'its', 'my', 'we', 'us'
-        }
-
-        # Job posting boilerplate words (appear in most job postings)
-        self.job_posting_stopwords = {
-            'responsibilities', 'responsibility', 'requirements', 'requirement',
-            'qualifications', 'qualification', 'preferred', 'required', 'must',
-            'candidate', 'candidates', 'position', 'role', 'opportunity',
-            'looking', 'seeking', 'hiring', 'join', 'team', 'company',
-            'ideal', 'strong', 'excellent', 'good', 'great', 'best',
-            'ability', 'able', 'skills', 'skill', 'experience', 'experienced',
-            'knowledge', 'understanding', 'familiar', 'familiarity',
-            'work', 'working', 'environment', 'based', 'including', 'includes',
-            'well', 'within', 'across', 'using', 'used', 'use',
-            'ensure', 'ensuring', 'provide', 'providing', 'support', 'supporting',
-            'develop', 'developing', 'development', 'create', 'creating',
-            'manage', 'managing', 'management', 'lead', 'leading',
-            'build', 'building', 'design', 'designing', 'implement', 'implementing',
-            'etc', 'other', 'others', 'various', 'multiple', 'different',
-            'minimum', 'maximum', 'least', 'plus', 'years', 'year',
-            'full', 'time', 'part', 'remote', 'onsite', 'hybrid', 'office',
-            'salary', 'benefits', 'compensation', 'package', 'competitive',
-            'equal', 'employer', 'employment', 'applicants', 'applicant'
-        }
-
-        # Common tech abbreviation mappings (abbreviation -> [full forms])
-        self.abbreviation_map = {
-            'js': ['javascript'],
-            'ts': ['typescript'],
-            'py': ['python'],
-            'rb': ['ruby'],
-            'ml': ['machine learning'],
-            'ai': ['artificial intelligence'],
-            'dl': ['deep learning'],
-            'nlp': ['natural language processing'],
-            'cv': ['computer vision'],
-            'aws': ['amazon web services'],
-            'gcp': ['google cloud platform', 'google cloud'],
-            'azure': ['microsoft azure'],
-            'k8s': ['kubernetes'],
-            'docker': ['containerization', 'containers'],
-            'ci': ['continuous integration'],
-            'cd': ['continuous deployment', 'continuous delivery'],
-            'cicd': ['ci/cd', 'continuous integration', 'continuous deployment'],
-            'api': ['apis', 'rest api', 'restful'],
-            'sql': ['mysql', 'postgresql', 'database'],
-            'nosql': ['mongodb', 'dynamodb', 'non-relational'],
-            'db': ['database', 'databases'],
-            'ui': ['user interface'],
-            'ux': ['user experience'],
-            'qa': ['quality assurance', 'testing'],
-            'pm': ['project management', 'product management'],
-            'scrum': ['agile', 'sprint'],
-            'agile': ['scrum', 'kanban', 'sprint'],
-            'oop': ['object oriented programming', 'object-oriented'],
-            'fp': ['functional programming'],
-            'tdd': ['test driven development', 'test-driven'],
-            'bdd': ['behavior driven development'],
-            'saas': ['software as a service'],
-            'paas': ['platform as a service'],
-            'iaas': ['infrastructure as a service'],
-            'rest': ['restful', 'rest api'],
-            'graphql': ['graph ql'],
-            'react': ['reactjs', 'react.js'],
-            'vue': ['vuejs', 'vue.js'],
-            'angular': ['angularjs', 'angular.js'],
-            'node': ['nodejs', 'node.js'],
-            'express': ['expressjs', 'express.js'],
-            'django': ['python django'],
-            'flask': ['python flask'],
-            'spring': ['spring boot', 'spring framework'],
-            'dotnet': ['.net', 'dot net', 'asp.net'],
-            'tf': ['tensorflow'],
-            'pytorch': ['torch'],
-            'pandas': ['data analysis'],
-            'numpy': ['numerical python'],
-            'git': ['github', 'gitlab', 'version control'],
-            'linux': ['unix', 'ubuntu', 'centos', 'redhat'],
-            'bash': ['shell', 'shell scripting'],
-            'powershell': ['windows scripting'],
-            'html': ['html5'],
-            'css': ['css3', 'styling'],
-            'sass': ['scss'],
-            'jwt': ['json web token', 'authentication'],
-            'oauth': ['oauth2', 'authentication'],
-            'sso': ['single sign-on'],
-            'sdk': ['software development kit'],
-            'ide': ['integrated development environment'],
-            'vscode': ['visual studio code'],
-            'jira': ['atlassian', 'issue tracking'],
-            'confluence': ['atlassian', 'documentation'],
-            'slack': ['team communication'],
-            'etl': ['extract transform load', 'data pipeline'],
-            'bi': ['business intelligence'],
-            'kpi': ['key performance indicator', 'metrics'],
-            'roi': ['return on investment'],
-            'b2b': ['business to business'],
-            'b2c': ['business to consumer'],
-            'crm': ['customer relationship management', 'salesforce'],
-            'erp': ['enterprise resource planning'],
-            'hr': ['human resources'],
-            'devops': ['dev ops', 'development operations'],
-            'sre': ['site reliability engineering', 'site reliability'],
-            'sla': ['service level agreement'],
-            'cdn': ['content delivery network'],
-            'dns': ['domain name system'],
-            'ssl': ['tls', 'https', 'security'],
-            'vpc': ['virtual private cloud'],
-            'ec2': ['elastic compute', 'aws compute'],
-            's3': ['aws storage', 'object storage'],
-            'rds': ['relational database service'],
-            'lambda': ['serverless', 'aws lambda'],
-        }
-
-        # Role/title suffix variations (manager <-> management, etc.)
-        self.role_variations = {
-            'manager': ['management', 'managing'],
-            'management': ['manager', 'managing'],
-            'engineer': ['engineering'],
-            'engineering': ['engineer'],
-            'developer': ['development', 'developing'],
-            'development': ['developer', 'developing'],
-            'analyst': ['analysis', 'analytics', 'analyzing'],
-            'analysis': ['analyst', 'analytics'],
-            'analytics': ['analyst', 'analysis'],
-            'architect': ['architecture', 'architecting'],
-            'architecture': ['architect'],
-            'administrator': ['administration', 'admin'],
-            'administration': ['administrator', 'admin'],
-            'admin': ['administrator', 'administration'],
-            'consultant': ['consulting', 'consultancy'],
-            'consulting': ['consultant', 'consultancy'],
-            'director': ['directing', 'directorship'],
-            'lead': ['leader', 'leading', 'leadership'],
-            'leader': ['lead', 'leading', 'leadership'],
-            'leadership': ['lead', 'leader', 'leading'],
-            'coordinator': ['coordination', 'coordinating'],
-            'coordination': ['coordinator', 'coordinating'],
-            'specialist': ['specialization', 'specialized'],
-            'supervisor': ['supervision', 'supervising'],
-            'programme': ['program', 'programs', 'programmes'],
-            'program': ['programme', 'programs', 'programmes'],
-            'project': ['projects'],
-            'projects': ['project'],
-        }
-
-        # Build reverse mapping (full form -> abbreviation)
-        self.reverse_abbreviation_map = {}
-        for abbr, full_forms in self.abbreviation_map.items():
-            for full_form in full_forms:
-                if full_form not in self.reverse_abbreviation_map:
-                    self.reverse_abbreviation_map[full_form] = []
-                self.reverse_abbreviation_map[full_form].append(abbr)
+        # Static vocabularies are shared, read-only module constants
+        self.base_stopwords = _BASE_STOPWORDS
+        self.ui_stopwords = _UI_STOPWORDS
+        self.job_posting_stopwords = _JOB_POSTING_STOPWORDS
+        self.abbreviation_map = _ABBREVIATION_MAP
+        self.role_variations = _ROLE_VARIATIONS
+        self.reverse_abbreviation_map = _REVERSE_ABBREVIATION_MAP
 
         # Initialize dynamic stopwords
         self.dynamic_stopwords = set()
         if company_name:
             self._add_company_variations(company_name)
+        self._refresh_stopwords()
 
-        # Initialize document parser for section-level analysis (Track 2.8)
-        self.document_parser = DocumentParser()
+        # Document parser for section-level analysis (Track 2.8)
+        self.document_parser = _get_document_parser()
 
-        # Initialize semantic scorer for semantic similarity (Track 2.8.2)
-        self.semantic_scorer = SemanticScorer()
+        # Semantic scorer for semantic similarity (Track 2.8.2)
+        self.semantic_scorer = _get_semantic_scorer()
 
     def _add_company_variations(self, company_name: str):
         """Add company name variations to stopwords"""
@@ -233,17 +388,50 @@ class ATSOptimizer:
             'llc', 'plc', 'group', 'holdings', 'company', 'co'
         }
         self.dynamic_stopwords.update(company_suffixes)
+        self._refresh_stopwords()
+
+    def _refresh_stopwords(self):
+        """Rebuild the cached stopword set and tokenizer after the stopword sets change.
+
+        Stopwords are rejected inside the regex by a negative lookahead, so
+        unigram extraction is a single findall instead of a per-token Python
+        filter. The ``-*(?![\\w-])`` tail mirrors where the tokenizer ends a
+        word, so only whole tokens are dropped (``full-time`` survives even
+        though ``full`` is a stopword). Only single-word stopwords go into the
+        alternation: a multi-word one (a company name) can never equal a
+        token, so it must not remove the first word of the phrase.
+        """
+        self._all_stopwords = frozenset(
+            self.base_stopwords | self.ui_stopwords |
+            self.job_posting_stopwords | self.dynamic_stopwords
+        )
+        alternation = '|'.join(
+            re.escape(word)
+            for word in sorted(self._all_stopwords, key=len, reverse=True)
+            if len(word.split()) == 1
+        )
+        self._unigram_re = re.compile(
+            rf'\b(?!(?:{alternation})-*(?![\w-]))[a-z][a-z0-9\-]{{1,}}\b'
+        )
 
-    def _extract_company_from_text(self, job_description: str):
-        """Extract likely company name from job description if not provided"""
-        patterns = [
+    _COMPANY_PATTERNS = tuple(
+        re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+        for pattern in (
             r'(?:company|organization|employer):\s*([A-Z][A-Za-z\s&]+?)(?:\n|\.|,)',
             r'(?:join|at)\s+([A-Z][A-Za-z\s&]+?)\s+(?:as|in|for)',
-            r'^([A-Z][A-Za-z\s&]+?)\s+is\s+(?:seeking|looking|hiring)'
-        ]
+            r'^([A-Z][A-Za-z\s&]+?)\s+is\s+(?:seeking|looking|hiring)',
+        )
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _extract_company_from_text(job_description: str):
+        """Extract likely company name from job description if not provided.
 
-        for pattern in patterns:
-            match = re.search(pattern, job_description, re.MULTILINE | re.IGNORECASE)
+        Cached per text: the same JD is re-scanned on every extract_keywords call.
+        """
+        for pattern in ATSOptimizer._COMPANY_PATTERNS:
+            match = pattern.search(job_description)
             if match:
                 company = match.group(1).strip()
                 if len(company.split()) <= 4:
@@ -251,34 +439,50 @@ class ATSOptimizer:
 
         return None
 
-    def get_all_stopwords(self):
-        """Get combined set of all stopwords"""
-        return (self.base_stopwords | self.ui_stopwords |
-                self.job_posting_stopwords | self.dynamic_stopwords)
+    def get_all_stopwords(self) -> frozenset:
+        """Get combined set of all stopwords (cached, rebuilt by _refresh_stopwords)"""
+        return self._all_stopwords
 
-    def _normalize_text(self, text: str) -> str:
-        """Normalize text for keyword extraction"""
+    # (trigger, pattern, replacement): a rewrite only runs when its literal
+    # trigger is in the text, so most JDs skip straight to the final pass.
+    _NORMALIZERS = (
+        # Normalize common variations
+        ('.js', re.compile(r'\.js\b'), 'js'),  # React.js -> Reactjs
+        ('.net', re.compile(r'\.net\b'), 'dotnet'),  # .NET -> dotnet
+        ('ci/cd', re.compile(r'\bci/cd\b'), 'cicd'),  # CI/CD -> cicd
+        ('c++', re.compile(r'\bc\+\+\b'), 'cpp'),  # C++ -> cpp
+        ('c#', re.compile(r'\bc#\b'), 'csharp'),  # C# -> csharp
+        ('f#', re.compile(r'\bf#\b'), 'fsharp'),  # F# -> fsharp
+    )
+    # Remove special chars but keep hyphens for compound words
+    _SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-]')
+    # The same substitution for ASCII text as a translate table
+    _SPECIAL_CHARS_TABLE = str.maketrans(
+        dict.fromkeys(filter(_SPECIAL_CHARS_RE.match, map(chr, range(128))), ' ')
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _normalize_text(text: str) -> str:
+        """Normalize text for keyword extraction.
+
+        Cached per text: one scoring pass normalizes both the CV and the JD
+        twice (keyword extraction, then phrase matching and keyword priority).
+        """
         # Convert to lowercase
         text = text.lower()
-        # Normalize common variations
-        text = re.sub(r'\.js\b', 'js', text)  # React.js -> Reactjs
-        text = re.sub(r'\.net\b', 'dotnet', text)  # .NET -> dotnet
-        text = re.sub(r'\bci/cd\b', 'cicd', text)  # CI/CD -> cicd
-        text = re.sub(r'\bc\+\+\b', 'cpp', text)  # C++ -> cpp
-        text = re.sub(r'\bc#\b', 'csharp', text)  # C# -> csharp
-        text = re.sub(r'\bf#\b', 'fsharp', text)  # F# -> fsharp
-        # Remove special chars but keep hyphens for compound words
-        text = re.sub(r'[^\w\s\-]', ' ', text)
-        return text
+        for trigger, pattern, replacement in ATSOptimizer._NORMALIZERS:
+            if trigger in text:
+                text = pattern.sub(replacement, text)
+        if text.isascii():
+            return text.translate(ATSOptimizer._SPECIAL_CHARS_TABLE)
+        return ATSOptimizer._SPECIAL_CHARS_RE.sub(' ', text)
 
     def extract_ngrams(self, text: str, n: int = 2) -> list:
         """Extract n-grams from text"""
         words = text.split()
-        ngrams = []
-        for i in range(len(words) - n + 1):
-            ngram = ' '.join(words[i:i+n])
-            ngrams.append(ngram)
-        return ngrams
+        # Zip n shifted views of the word list into sliding windows
+        return [' '.join(gram) for gram in zip(*(words[i:] for i in range(n)))]
 
     def extract_keywords(self, text: str, auto_detect_company: bool = True) -> dict:
         """
@@ -295,71 +499,151 @@ class ATSOptimizer:
             if detected_company:
                 self._add_company_variations(detected_company)
 
+        cache_key = (
+            hashlib.blake2b(text.encode(), digest_size=16).digest(),
+            self._all_stopwords,
+        )
+        with self._keywords_cache_lock:
+            cached = self._keywords_cache.get(cache_key)
+            if cached is not None:
+                self._keywords_cache.move_to_end(cache_key)
+        if cached is not None:
+            # Hand out copies so callers can't mutate the cached counters
+            return {name: Counter(counts) for name, counts in cached.items()}
+
         # Normalize text
         normalized = self._normalize_text(text)
 
         # Get all stopwords
         all_stopwords = self.get_all_stopwords()
 
-        # Extract unigrams (single words, min 2 chars)
-        words = re.findall(r'\b[a-z][a-z0-9\-]{1,}\b', normalized)
-        unigrams = [w for w in words if w not in all_stopwords and len(w) >= 2]
-
-        # Extract bigrams (2-word phrases)
-        bigrams = []
-        for bigram in self.extract_ngrams(normalized, 2):
-            words_in_bigram = bigram.split()
-            # Keep if at least one word is not a stopword
-            if any(w not in all_stopwords and len(w) >= 2 for w in words_in_bigram):
-                # Skip if all words are stopwords
-                if not all(w in all_stopwords for w in words_in_bigram):
-                    bigrams.append(bigram)
-
-        # Extract trigrams (3-word phrases)
-        trigrams = []
-        for trigram in self.extract_ngrams(normalized, 3):
-            words_in_trigram = trigram.split()
-            # Keep if at least two words are meaningful
-            meaningful = [w for w in words_in_trigram if w not in all_stopwords and len(w) >= 2]
-            if len(meaningful) >= 2:
-                trigrams.append(trigram)
+        words = normalized.split()
+
+        # Extract unigrams (single words, min 2 chars, stopwords rejected).
+        # Plain ASCII alphanumeric words (the vast majority) are a token
+        # exactly when the regex would take them whole; anything with
+        # hyphens, underscores, leading digits or non-ASCII goes through it
+        unigrams = []
+        for word in words:
+            if word.isascii() and word.isalnum():
+                if len(word) >= 2 and word[0].isalpha() and word not in all_stopwords:
+                    unigrams.append(word)
+            else:
+                unigrams.extend(self._unigram_re.findall(word))
+
+        # Flag each word once; a word is meaningful if it is not a stopword
+        # and has at least 2 chars. The n-gram filters then only look at flags.
+        meaningful = [w not in all_stopwords and len(w) >= 2 for w in words]
+
+        # Count n-grams straight from generators; no intermediate lists
+        # Bigrams (2-word phrases): keep if at least one word is meaningful
+        bigram_counts = Counter(
+            f'{w1} {w2}'
+            for w1, w2, m1, m2 in zip(words, words[1:], meaningful, meaningful[1:])
+            if m1 or m2
+        )
 
-        return {
-            'unigrams': Counter(unigrams),
-            'bigrams': Counter(bigrams),
-            'trigrams': Counter(trigrams),
-            'all': Counter(unigrams)  # For backward compatibility
+        # Trigrams (3-word phrases): keep if at least two words are meaningful
+        trigram_counts = Counter(
+            f'{w1} {w2} {w3}'
+            for w1, w2, w3, m1, m2, m3 in zip(
+                words, words[1:], words[2:],
+                meaningful, meaningful[1:], meaningful[2:],
+            )
+            if m1 + m2 + m3 >= 2
+        )
+
+        unigram_counts = Counter(unigrams)
+        result = {
+            'unigrams': unigram_counts,
+            'bigrams': bigram_counts,
+            'trigrams': trigram_counts,
+            'all': Counter(unigram_counts)  # For backward compatibility
         }
 
+        with self._keywords_cache_lock:
+            self._keywords_cache[cache_key] = {name: Counter(counts) for name, counts in result.items()}
+            if len(self._keywords_cache) > self._KEYWORDS_CACHE_SIZE:
+                self._keywords_cache.popitem(last=False)
+
+        return result
+
     def _expand_with_synonyms(self, keywords: set) -> set:
         """Expand keyword set with known synonyms/abbreviations and role variations"""
-        expanded = set(keywords)
+        return set(self._expand_keywords(frozenset(keywords)))
 
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _expand_keywords(keywords: frozenset) -> frozenset:
+        """Cached expansion: scoring expands the same CV unigram set and the same
+        LLM keywords again on every re-score of a job."""
+        expanded = set(keywords)
         for keyword in keywords:
-            keyword_lower = keyword.lower()
-
-            # Check if it's an abbreviation
-            if keyword_lower in self.abbreviation_map:
-                expanded.update(self.abbreviation_map[keyword_lower])
+            expanded.update(ATSOptimizer._keyword_variants(keyword.lower()))
+        return frozenset(expanded)
 
-            # Check if it has an abbreviation
-            if keyword_lower in self.reverse_abbreviation_map:
-                expanded.update(self.reverse_abbreviation_map[keyword_lower])
-
-            # Check role variations (manager <-> management, etc.)
-            if keyword_lower in self.role_variations:
-                expanded.update(self.role_variations[keyword_lower])
-
-            # For multi-word phrases, expand each word
-            words = keyword_lower.split()
-            if len(words) > 1:
-                for i, word in enumerate(words):
-                    if word in self.role_variations:
-                        for variation in self.role_variations[word]:
-                            new_phrase = ' '.join(words[:i] + [variation] + words[i+1:])
-                            expanded.add(new_phrase)
-
-        return expanded
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _keyword_variants(keyword_lower: str) -> frozenset:
+        """Synonyms, abbreviations and role variations of one lowercased keyword."""
+        # Abbreviations, full forms and role variations (manager <-> management, etc.)
+        variants = set(_SYNONYMS.get(keyword_lower, ()))
+
+        # For multi-word phrases, expand each word
+        words = keyword_lower.split()
+        if len(words) > 1:
+            for i, word in enumerate(words):
+                if word in _ROLE_VARIATIONS:
+                    for variation in _ROLE_VARIATIONS[word]:
+                        new_phrase = ' '.join(words[:i] + [variation] + words[i+1:])
+                        variants.add(new_phrase)
+
+        return frozenset(variants)
+
+    @classmethod
+    def _keyword_in_cv(cls, keyword: str, cv_text: str, cv_unigrams: set) -> bool:
+        """Check if a keyword or its synonyms appear in CV"""
+        keyword_lower = keyword.lower().strip()
+
+        # Set lookups first; the phrase scans over the CV text are the slow part
+        variants = cls._keyword_variants(keyword_lower)
+        if keyword_lower in cv_unigrams or not variants.isdisjoint(cv_unigrams):
+            return True
+
+        # Direct phrase match in text, then synonyms/abbreviations
+        if keyword_lower in cv_text:
+            return True
+        return any(variant in cv_text for variant in variants)
+
+    _REQUIREMENT_KEYS = (
+        'tools', 'methodologies', 'certifications', 'management',
+        'industry_terms', 'transferable_skills', 'experience_level',
+        'regulations', 'metrics', 'preferred',
+    )
+
+    # Lowercase header (without the colon) -> result category: the 10 current
+    # categories in underscore, space and hyphen spellings, plus legacy
+    # headers remapped for old LLM outputs (cached key_requirements in DB)
+    _REQUIREMENT_HEADER_MAP = {
+        **{
+            variant: key
+            for key in _REQUIREMENT_KEYS
+            for variant in (key, key.replace('_', ' '), key.replace('_', '-'))
+        },
+        'hard_skills': 'tools',
+        'hard skills': 'tools',
+        'critical_keywords': 'tools',
+        'critical keywords': 'tools',
+        'required': 'tools',
+        'must have': 'tools',
+        'soft_skills': 'transferable_skills',
+        'soft skills': 'transferable_skills',
+        'qualifications': 'certifications',
+        'required qualifications': 'certifications',
+    }
+    _REQUIREMENT_HEADER_RE = re.compile(
+        '(' + '|'.join(re.escape(header) for header in _REQUIREMENT_HEADER_MAP) + '):'
+    )
 
     def _parse_llm_requirements(self, llm_output: str) -> dict:
         """Parse the structured output from LLM requirement identification.
@@ -367,33 +651,7 @@ class ATSOptimizer:
         Supports both the current 10-category format and the legacy 6-category
         format (backward compat for cached key_requirements in DB).
         """
-        result = {
-            'tools': [],
-            'methodologies': [],
-            'certifications': [],
-            'management': [],
-            'industry_terms': [],
-            'transferable_skills': [],
-            'experience_level': [],
-            'regulations': [],
-            'metrics': [],
-            'preferred': [],
-        }
-
-        # Legacy → new category remapping for old LLM outputs
-        _legacy_map = {
-            'hard_skills': 'tools',
-            'hard skills': 'tools',
-            'critical_keywords': 'tools',
-            'critical keywords': 'tools',
-            'required': 'tools',
-            'must have': 'tools',
-            'soft_skills': 'transferable_skills',
-            'soft skills': 'transferable_skills',
-            'qualifications': 'certifications',
-            'required qualifications': 'certifications',
-        }
-
+        result = {key: [] for key in self._REQUIREMENT_KEYS}
         current_section = None
 
         for line in llm_output.split('\n'):
@@ -401,35 +659,12 @@ class ATSOptimizer:
             if not line:
                 continue
 
-            line_lower = line.lower()
-
-            # Try matching new 10-category headers first (space or underscore variants)
-            matched_header = None
-            for key in result:
-                variants = [
-                    key + ':',
-                    key.replace('_', ' ') + ':',
-                    key.replace('_', '-') + ':',
-                ]
-                if any(line_lower.startswith(v) for v in variants):
-                    matched_header = key
-                    break
-
-            if matched_header:
-                current_section = matched_header
+            header = self._REQUIREMENT_HEADER_RE.match(line.lower())
+            if header:
+                current_section = self._REQUIREMENT_HEADER_MAP[header.group(1)]
                 content = line.split(':', 1)[1].strip()
             else:
-                # Try legacy headers
-                legacy_match = None
-                for legacy_key, new_key in _legacy_map.items():
-                    if line_lower.startswith(legacy_key + ':'):
-                        legacy_match = new_key
-                        break
-                if legacy_match:
-                    current_section = legacy_match
-                    content = line.split(':', 1)[1].strip()
-                else:
-                    content = line
+                content = line
 
             if current_section and content:
                 items = [item.strip() for item in content.split(',') if item.strip()]
@@ -437,14 +672,7 @@ class ATSOptimizer:
 
         return result
 
-    def identify_key_requirements(self, job_description: str) -> str:
-        """Use LLM to identify critical requirements and keywords"""
-
-        system_message = """You extract keywords from job descriptions into 10 categories. Output ONLY the structured format shown. DO NOT add any preamble, explanation, or commentary. Start your response directly with "TOOLS:" on the first line."""
-
-        prompt = f"""Extract keywords from this job description into the 10 categories below.
-Categories:
-- TOOLS: software, platforms, frameworks, programming languages
+    _REQUIREMENT_CATEGORIES = """- TOOLS: software, platforms, frameworks, programming languages
 - METHODOLOGIES: ways of working (Agile, ITIL, Prince2, Lean, DevOps)
 - CERTIFICATIONS: formal qualifications, degrees, professional certs
 - MANAGEMENT: leadership, management, budget, P&L, team, stakeholder skills
@@ -453,13 +681,9 @@ Categories:
 - EXPERIENCE LEVEL: seniority signals (senior, strategic, executive, years of experience)
 - REGULATIONS: compliance, regulatory frameworks (GDPR, FCA, SOC2)
 - METRICS: measurable outcomes (KPIs, OKRs, cost reduction, NPS)
-- PREFERRED: explicitly nice-to-have or advantageous skills only
-
-Job description:
-{job_description}
+- PREFERRED: explicitly nice-to-have or advantageous skills only"""
 
----
-TOOLS: keyword1, keyword2, keyword3
+    _REQUIREMENT_FORMAT = """TOOLS: keyword1, keyword2, keyword3
 METHODOLOGIES: keyword1, keyword2, keyword3
 CERTIFICATIONS: keyword1, keyword2
 MANAGEMENT: keyword1, keyword2, keyword3
@@ -470,6 +694,36 @@ REGULATIONS: keyword1, keyword2
 METRICS: keyword1, keyword2
 PREFERRED: keyword1, keyword2"""
 
+    # "=== JD 2 ===" delimiters in batched requirement responses
+    _BATCH_DELIMITER_RE = re.compile(r'^\s*=+\s*JD\s+(\d+)\s*=+\s*$', re.MULTILINE | re.IGNORECASE)
+
+    def identify_key_requirements(self, job_description: str) -> str:
+        """Use LLM to identify critical requirements and keywords.
+
+        Results are served from the shared RequirementsCache when the same
+        (or a near-identical) job description was analysed by the same backend.
+        """
+        backend_name = self.backend.get_backend_name()
+        cached = self._requirements_cache.get_exact(backend_name, job_description)
+        if cached is not None:
+            return cached
+        embedding = self.semantic_scorer.embed_document(job_description)
+        cached = self._requirements_cache.get_similar(backend_name, embedding)
+        if cached is not None:
+            return cached
+
+        system_message = """You extract keywords from job descriptions into 10 categories. Output ONLY the structured format shown. DO NOT add any preamble, explanation, or commentary. Start your response directly with "TOOLS:" on the first line."""
+
+        prompt = f"""Extract keywords from this job description into the 10 categories below.
+Categories:
+{self._REQUIREMENT_CATEGORIES}
+
+Job description:
+{job_description}
+
+---
+{self._REQUIREMENT_FORMAT}"""
+
         messages = [
             {'role': 'system', 'content': system_message},
             {'role': 'user', 'content': prompt}
@@ -478,7 +732,104 @@ PREFERRED: keyword1, keyword2"""
         response = self.backend.chat(messages, temperature=0.3, max_tokens=1024)
 
         # Clean up any preamble/thinking the LLM might have added
-        return self._clean_llm_output(response)
+        requirements = self._clean_llm_output(response)
+        self._requirements_cache.put(backend_name, job_description, embedding, requirements)
+        return requirements
+
+    def identify_key_requirements_batch(self, job_descriptions: list[str], batch_size: int = 4) -> list[str]:
+        """Identify requirements for several job descriptions with fewer LLM calls.
+
+        Cache hits are answered directly; the remaining JDs are packed up to
+        batch_size per prompt. Any JD whose block is missing from a batched
+        response falls back to a single identify_key_requirements call.
+        Returns one requirements string per input, in input order.
+        """
+        backend_name = self.backend.get_backend_name()
+        results: list[Optional[str]] = [None] * len(job_descriptions)
+        misses: dict[str, tuple[list[int], Any]] = {}
+
+        for i, jd in enumerate(job_descriptions):
+            cached = self._requirements_cache.get_exact(backend_name, jd)
+            if cached is None and jd.strip() not in misses:
+                embedding = self.semantic_scorer.embed_document(jd)
+                cached = self._requirements_cache.get_similar(backend_name, embedding)
+                if cached is None:
+                    misses[jd.strip()] = ([], embedding)
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses[jd.strip()][0].append(i)
+
+        pending = list(misses.items())
+        for start in range(0, len(pending), max(batch_size, 1)):
+            chunk = pending[start:start + max(batch_size, 1)]
+            blocks = self._request_requirements_batch([jd for jd, _ in chunk])
+            for n, (jd, (indices, embedding)) in enumerate(chunk, start=1):
+                requirements = blocks.get(n)
+                if requirements is None:
+                    requirements = self.identify_key_requirements(jd)
+                else:
+                    self._requirements_cache.put(backend_name, jd, embedding, requirements)
+                for i in indices:
+                    results[i] = requirements
+
+        return results
+
+    def _request_requirements_batch(self, job_descriptions: list[str]) -> dict[int, str]:
+        """Send one prompt covering several JDs; return cleaned blocks by 1-based JD number."""
+        system_message = f"""You extract keywords from job descriptions into 10 categories. You will receive {len(job_descriptions)} numbered job descriptions. For each one output a "=== JD n ===" line followed by the structured format shown. DO NOT add any preamble, explanation, or commentary."""
+
+        numbered = '\n\n'.join(
+            f"JD {n}:\n{jd}" for n, jd in enumerate(job_descriptions, start=1)
+        )
+        prompt = f"""Extract keywords from each job description below into the 10 categories.
+Categories:
+{self._REQUIREMENT_CATEGORIES}
+
+Job descriptions:
+{numbered}
+
+---
+=== JD 1 ===
+{self._REQUIREMENT_FORMAT}"""
+
+        messages = [
+            {'role': 'system', 'content': system_message},
+            {'role': 'user', 'content': prompt}
+        ]
+
+        response = self.backend.chat(
+            messages, temperature=0.3, max_tokens=1024 * len(job_descriptions)
+        )
+
+        # re.split with a capture group yields [preamble, n1, block1, n2, block2, ...]
+        parts = self._BATCH_DELIMITER_RE.split(response)
+        blocks = {}
+        for number, block in zip(parts[1::2], parts[2::2]):
+            n = int(number)
+            if not 1 <= n <= len(job_descriptions) or n in blocks:
+                continue
+            requirements = self._clean_llm_output(block)
+            # Blocks without any recognised category are treated as missing
+            if any(self._parse_llm_requirements(requirements).values()):
+                blocks[n] = requirements
+        return blocks
+
+    _REQUIREMENT_HEADERS = (
+        'TOOLS:', 'METHODOLOGIES:', 'CERTIFICATIONS:', 'MANAGEMENT:',
+        'INDUSTRY TERMS:', 'INDUSTRY_TERMS:', 'TRANSFERABLE SKILLS:', 'TRANSFERABLE_SKILLS:',
+        'EXPERIENCE LEVEL:', 'EXPERIENCE_LEVEL:', 'REGULATIONS:', 'METRICS:', 'PREFERRED:',
+        # Legacy headers (backward compat)
+        'HARD SKILLS:', 'SOFT SKILLS:', 'QUALIFICATIONS:',
+        'CRITICAL KEYWORDS:', 'REQUIRED:',
+    )
+
+    # Thinking/explanation phrases that end the structured output
+    _THINKING_RE = re.compile('|'.join(re.escape(phrase) for phrase in (
+        'however,', 'upon re-reading', 'i realized', 'i found',
+        'let me', 'note that', 'additionally,', 'note:',
+        'here is the', 'i have', 'based on',
+    )))
 
     def _clean_llm_output(self, text: str) -> str:
         """Remove LLM preamble and keep only the structured output."""
@@ -486,38 +837,27 @@ PREFERRED: keyword1, keyword2"""
         cleaned_lines = []
         started = False
 
-        valid_headers = [
-            'TOOLS:', 'METHODOLOGIES:', 'CERTIFICATIONS:', 'MANAGEMENT:',
-            'INDUSTRY TERMS:', 'INDUSTRY_TERMS:', 'TRANSFERABLE SKILLS:', 'TRANSFERABLE_SKILLS:',
-            'EXPERIENCE LEVEL:', 'EXPERIENCE_LEVEL:', 'REGULATIONS:', 'METRICS:', 'PREFERRED:',
-            # Legacy headers (backward compat)
-            'HARD SKILLS:', 'SOFT SKILLS:', 'QUALIFICATIONS:',
-            'CRITICAL KEYWORDS:', 'REQUIRED:',
-        ]
-
         for line in lines:
             line_stripped = line.strip()
-            line_upper = line_stripped.upper()
+            is_header = line_stripped.upper().startswith(self._REQUIREMENT_HEADERS)
 
             # Start capturing when we see a valid section header
-            if any(line_upper.startswith(header) for header in valid_headers):
+            if is_header:
                 started = True
 
             # Only capture lines after we've started (skip preamble)
             if started:
-                # Stop if we hit thinking/explanation text mid-output
-                line_lower = line_stripped.lower()
-                if any(phrase in line_lower for phrase in
-                       ['however,', 'upon re-reading', 'i realized', 'i found',
-                        'let me', 'note that', 'additionally,', 'note:',
-                        'here is the', 'i have', 'based on']):
-                    # Only break if this line doesn't contain a valid header
-                    if not any(line_upper.startswith(header) for header in valid_headers):
-                        break
+                # Stop if we hit thinking/explanation text mid-output,
+                # unless this line is itself a valid header
+                if not is_header and self._THINKING_RE.search(line_stripped.lower()):
+                    break
                 cleaned_lines.append(line)
 
         return '\n'.join(cleaned_lines) if cleaned_lines else text
 
+    _SECTION_MATCH_PRIORITY = {'experience': 0, 'projects': 1, 'skills': 2}
+    _SECTION_MATCH_BUCKETS = ('experience_matches', 'projects_matches', 'skills_matches', 'other_matches')
+
     def _calculate_section_match(self, parsed_cv: ParsedCV, parsed_jd: ParsedJD) -> dict:
         """
         Calculate section-level matching between CV and JD.
@@ -531,42 +871,25 @@ PREFERRED: keyword1, keyword2"""
             'not_found': []            # Required skills not found
         }
 
-        # Get required skills from JD
-        jd_required = {e.text.lower() for e in parsed_jd.required_entities}
-        jd_preferred = {e.text.lower() for e in parsed_jd.preferred_entities}
-        all_jd_skills = jd_required | jd_preferred
+        # Get required and preferred skills from JD
+        all_jd_skills = parsed_jd.required_or_preferred_texts
 
-        # Check each CV entity and categorize by section
-        cv_skills_by_section = {}
+        # Index each CV skill to the best section it appears in
+        # (experience > projects > skills > anywhere else)
+        best_rank = {}
         for entity in parsed_cv.entities:
-            skill_lower = entity.text.lower()
-            section = entity.section or 'unknown'
-            if section not in cv_skills_by_section:
-                cv_skills_by_section[section] = set()
-            cv_skills_by_section[section].add(skill_lower)
+            skill_lower = entity.text_lower
+            rank = self._SECTION_MATCH_PRIORITY.get(entity.section, 3)
+            if rank < best_rank.get(skill_lower, 4):
+                best_rank[skill_lower] = rank
 
         # Find where each JD skill appears in CV
         for skill in all_jd_skills:
-            found = False
-            if skill in cv_skills_by_section.get('experience', set()):
-                section_matches['experience_matches'].append(skill)
-                found = True
-            elif skill in cv_skills_by_section.get('projects', set()):
-                section_matches['projects_matches'].append(skill)
-                found = True
-            elif skill in cv_skills_by_section.get('skills', set()):
-                section_matches['skills_matches'].append(skill)
-                found = True
-            else:
-                # Check all sections
-                for section, skills in cv_skills_by_section.items():
-                    if skill in skills:
-                        section_matches['other_matches'].append(skill)
-                        found = True
-                        break
-
-            if not found:
+            rank = best_rank.get(skill)
+            if rank is None:
                 section_matches['not_found'].append(skill)
+            else:
+                section_matches[self._SECTION_MATCH_BUCKETS[rank]].append(skill)
 
         return section_matches
 
@@ -709,16 +1032,14 @@ PREFERRED: keyword1, keyword2"""
         }
 
         # Get required skills from JD
-        jd_skills = {e.text.lower() for e in parsed_jd.entities
-                     if e.entity_type in (EntityType.HARD_SKILL, EntityType.SOFT_SKILL)}
+        jd_skills = parsed_jd.skill_texts
 
         # Calculate evidence for each matched skill
         total_strength = 0.0
         count = 0
 
         for entity in parsed_cv.entities:
-            skill_lower = entity.text.lower()
-            if skill_lower in jd_skills:
+            if entity.text_lower in jd_skills:
                 count += 1
                 total_strength += entity.evidence_strength
 
@@ -803,7 +1124,88 @@ PREFERRED: keyword1, keyword2"""
             'semantic_available': semantic_result.available,
         }
 
-    def calculate_ats_score(self, cv_text: str, job_description: str, key_requirements: str) -> dict:
+    def _analyze_documents(self, cv_text: str, job_description: str) -> dict:
+        """Run the parts of ATS scoring that don't depend on the LLM requirements.
+
+        Kept separate so generate_ats_report can run it while the requirements
+        request is still in flight.
+
+        When an embedding model is available, semantic scoring runs on a worker
+        thread alongside the lexical work. Keyword extraction stays on this
+        thread and in order: the job description pass can register a detected
+        company name as stopwords for the CV pass.
+        """
+        # Parse documents for section-level analysis (Track 2.8)
+        parsed_cv = self._parse_document('cv', cv_text)
+        parsed_jd = self._parse_document('jd', job_description)
+
+        if not self.semantic_scorer.is_available():
+            return self._collect_analysis(
+                cv_text, job_description, parsed_cv, parsed_jd,
+                self.semantic_scorer.calculate_semantic_score(parsed_cv, parsed_jd),
+            )
+
+        # Calculate semantic similarity score (Track 2.8.2) in the background
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            semantic_future = executor.submit(
+                self.semantic_scorer.calculate_semantic_score, parsed_cv, parsed_jd
+            )
+            return self._collect_analysis(
+                cv_text, job_description, parsed_cv, parsed_jd, semantic_future
+            )
+
+    def _parse_document(self, kind: str, text: str):
+        """Parse a CV ('cv') or job description ('jd'), reusing earlier parses."""
+        cache_key = (kind, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        with self._parsed_cache_lock:
+            cached = self._parsed_cache.get(cache_key)
+            if cached is not None:
+                self._parsed_cache.move_to_end(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        if kind == 'cv':
+            parsed = self.document_parser.parse_cv(text)
+        else:
+            parsed = self.document_parser.parse_jd(text)
+
+        with self._parsed_cache_lock:
+            self._parsed_cache[cache_key] = copy.deepcopy(parsed)
+            if len(self._parsed_cache) > self._PARSED_CACHE_SIZE:
+                self._parsed_cache.popitem(last=False)
+
+        return parsed
+
+    def _collect_analysis(
+        self, cv_text: str, job_description: str, parsed_cv, parsed_jd, semantic_result
+    ) -> dict:
+        """Run the lexical analyses and assemble the _analyze_documents result.
+
+        semantic_result is either the semantic score or a future resolving to it.
+        """
+        analysis = {
+            'parsed_cv': parsed_cv,
+            'parsed_jd': parsed_jd,
+            # Calculate section-level matching
+            'section_matches': self._calculate_section_match(parsed_cv, parsed_jd),
+            # Calculate evidence-weighted scores
+            'evidence_scores': self._calculate_evidence_scores(parsed_cv, parsed_jd),
+            # Extract keywords from both documents
+            'job_keywords': self.extract_keywords(job_description),
+            'cv_keywords': self.extract_keywords(cv_text),
+        }
+        if isinstance(semantic_result, Future):
+            semantic_result = semantic_result.result()
+        analysis['semantic_result'] = semantic_result
+        return analysis
+
+    def calculate_ats_score(
+        self,
+        cv_text: str,
+        job_description: str,
+        key_requirements: str,
+        analysis: Optional[dict] = None,
+    ) -> dict:
         """
         Calculate how well the CV matches the job description.
         Uses weighted scoring based on:
@@ -813,27 +1215,56 @@ PREFERRED: keyword1, keyword2"""
         - Synonym/abbreviation matching
         - Section-level matching (Track 2.8)
         - Evidence-weighted scoring (Track 2.8)
-        """
 
-        # Parse LLM requirements
-        parsed_reqs = self._parse_llm_requirements(key_requirements)
+        analysis may be a precomputed result of _analyze_documents for the same
+        cv_text and job_description.
 
-        # Parse documents for section-level analysis (Track 2.8)
-        parsed_cv = self.document_parser.parse_cv(cv_text)
-        parsed_jd = self.document_parser.parse_jd(job_description)
+        Results are cached on the three input texts and the active stopwords,
+        so re-scoring an unchanged CV against the same job is a lookup.
+        """
+        cache_key = (
+            tuple(
+                hashlib.blake2b(text.encode(), digest_size=16).digest()
+                for text in (cv_text, job_description, key_requirements)
+            ),
+            self._all_stopwords,
+        )
+        with self._score_cache_lock:
+            cached = self._score_cache.get(cache_key)
+            if cached is not None:
+                self._score_cache.move_to_end(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
-        # Calculate section-level matching
-        section_matches = self._calculate_section_match(parsed_cv, parsed_jd)
+        result = self._score_documents(cv_text, job_description, key_requirements, analysis)
 
-        # Calculate evidence-weighted scores
-        evidence_scores = self._calculate_evidence_scores(parsed_cv, parsed_jd)
+        with self._score_cache_lock:
+            self._score_cache[cache_key] = copy.deepcopy(result)
+            if len(self._score_cache) > self._SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
 
-        # Calculate semantic similarity score (Track 2.8.2)
-        semantic_result = self.semantic_scorer.calculate_semantic_score(parsed_cv, parsed_jd)
+        return result
+
+    def _score_documents(
+        self,
+        cv_text: str,
+        job_description: str,
+        key_requirements: str,
+        analysis: Optional[dict],
+    ) -> dict:
+        """Uncached body of calculate_ats_score."""
+        # Parse LLM requirements
+        parsed_reqs = self._parse_llm_requirements(key_requirements)
 
-        # Extract keywords from both documents
-        job_keywords = self.extract_keywords(job_description)
-        cv_keywords = self.extract_keywords(cv_text)
+        if analysis is None:
+            analysis = self._analyze_documents(cv_text, job_description)
+        parsed_cv = analysis['parsed_cv']
+        parsed_jd = analysis['parsed_jd']
+        section_matches = analysis['section_matches']
+        evidence_scores = analysis['evidence_scores']
+        semantic_result = analysis['semantic_result']
+        job_keywords = analysis['job_keywords']
+        cv_keywords = analysis['cv_keywords']
 
         # Build CV keyword sets for matching (including synonyms)
         cv_unigrams = set(cv_keywords['unigrams'].keys())
@@ -859,26 +1290,6 @@ PREFERRED: keyword1, keyword2"""
             'frequency_keywords':  {'matched': [], 'missing': [], 'weight': 0.5},
         }
 
-        def check_keyword_match(keyword: str, cv_text: str, cv_unigrams: set) -> bool:
-            """Check if a keyword or its synonyms appear in CV"""
-            keyword_lower = keyword.lower().strip()
-
-            # Direct phrase match in text
-            if keyword_lower in cv_text:
-                return True
-
-            # Single word match
-            if keyword_lower in cv_unigrams:
-                return True
-
-            # Check synonyms/abbreviations
-            expanded = self._expand_with_synonyms({keyword_lower})
-            for variant in expanded:
-                if variant in cv_text or variant in cv_unigrams:
-                    return True
-
-            return False
-
         # Score LLM-identified keywords across all 10 categories
         for category in [
             'tools', 'methodologies', 'certifications', 'management',
@@ -886,7 +1297,7 @@ PREFERRED: keyword1, keyword2"""
             'regulations', 'metrics', 'preferred',
         ]:
             for keyword in parsed_reqs.get(category, []):
-                if check_keyword_match(keyword, cv_all_text, cv_unigrams_expanded):
+                if self._keyword_in_cv(keyword, cv_all_text, cv_unigrams_expanded):
                     scores[category]['matched'].append(keyword)
                 else:
                     scores[category]['missing'].append(keyword)
@@ -895,17 +1306,20 @@ PREFERRED: keyword1, keyword2"""
         top_job_unigrams = [k for k, v in job_keywords['unigrams'].most_common(20)]
         top_job_bigrams = [k for k, v in job_keywords['bigrams'].most_common(15)]
 
+        # Keywords already tracked by an LLM category (lowercased)
+        tracked_lower = {
+            k.lower()
+            for cat, data in scores.items() if cat != 'frequency_keywords'
+            for k in data['matched'] + data['missing']
+        }
+
+        frequency = scores['frequency_keywords']
         for keyword in top_job_unigrams:
-            if keyword not in cv_unigrams_expanded:
-                # Check if not already tracked
-                already_tracked = any(
-                    keyword.lower() in [k.lower() for k in scores[cat]['matched'] + scores[cat]['missing']]
-                    for cat in scores if cat != 'frequency_keywords'
-                )
-                if not already_tracked:
-                    scores['frequency_keywords']['missing'].append(keyword)
-            else:
-                scores['frequency_keywords']['matched'].append(keyword)
+            if keyword in cv_unigrams_expanded:
+                frequency['matched'].append(keyword)
+            # Only report a miss if an LLM category isn't already tracking it
+            elif keyword.lower() not in tracked_lower:
+                frequency['missing'].append(keyword)
 
         # Check bigrams (phrases) - these are important!
         matched_bigrams = []
@@ -945,10 +1359,8 @@ PREFERRED: keyword1, keyword2"""
             all_missing.extend(data['missing'])
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_matched = [x for x in all_matched if not (x.lower() in seen or seen.add(x.lower()))]
-        seen = set()
-        unique_missing = [x for x in all_missing if not (x.lower() in seen or seen.add(x.lower()))]
+        unique_matched = self._dedupe_case_insensitive(all_matched)
+        unique_missing = self._dedupe_case_insensitive(all_missing)
 
         result = {
             'score': round(final_score, 1),
@@ -1072,6 +1484,14 @@ PREFERRED: keyword1, keyword2"""
 
         return result
 
+    @staticmethod
+    def _dedupe_case_insensitive(items: list[str]) -> list[str]:
+        """Drop case-insensitive duplicates, keeping the first spelling seen."""
+        unique = {}
+        for item in items:
+            unique.setdefault(item.lower(), item)
+        return list(unique.values())
+
     @staticmethod
     def _compute_keyword_priority(
         keyword: str,
@@ -1416,10 +1836,16 @@ Generate the complete CV now:"""
         """Generate a comprehensive ATS analysis report"""
 
         print("\n[ATS] Analyzing job description for ATS requirements...")
-        key_requirements = self.identify_key_requirements(job_description)
+        # The LLM call is network-bound; parse and score the documents meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            requirements_future = executor.submit(self.identify_key_requirements, job_description)
+            analysis = self._analyze_documents(cv_text, job_description)
+            key_requirements = requirements_future.result()
 
         print("\n[ATS] Calculating ATS match score (enhanced algorithm)...")
-        ats_score = self.calculate_ats_score(cv_text, job_description, key_requirements)
+        ats_score = self.calculate_ats_score(
+            cv_text, job_description, key_requirements, analysis=analysis
+        )
 
         # Build category breakdown table
         category_labels = {
@@ -1440,70 +1866,70 @@ Generate the complete CV now:"""
         hybrid_data = ats_score.get('hybrid_scoring', {})
         semantic_data = ats_score.get('semantic_analysis', {})
 
-        # Format report with tables
-        report = f"""
+        # Format report with tables (collected in parts, joined once at the end)
+        report_parts = [f"""
 ================================================================================
               ATS OPTIMIZATION REPORT v3.0 (Hybrid Scoring)
 ================================================================================
 
   FINAL SCORE: {ats_score['score']}%    |    Keywords Matched: {ats_score['matched']} / {ats_score['total']}
-"""
+"""]
 
         if self.company_name:
-            report += f"  Company excluded: {self.company_name}\n"
+            report_parts.append(f"  Company excluded: {self.company_name}\n")
 
         # Hybrid Scoring Breakdown (Track 2.8.2)
         if hybrid_data:
-            report += """
+            report_parts.append("""
 --------------------------------------------------------------------------------
                    HYBRID SCORING BREAKDOWN (Track 2.8.2)
 --------------------------------------------------------------------------------
-"""
-            report += f"  Final Score: {hybrid_data.get('final_score', 0)}%\n\n"
-            report += "  Components:\n"
-            report += f"    Lexical:   {hybrid_data.get('lexical_score', 0):>5.1f}% x {int(hybrid_data.get('lexical_weight', 0)*100):>2}% = {hybrid_data.get('lexical_contribution', 0):>5.1f}\n"
+""")
+            report_parts.append(f"  Final Score: {hybrid_data.get('final_score', 0)}%\n\n")
+            report_parts.append("  Components:\n")
+            report_parts.append(f"    Lexical:   {hybrid_data.get('lexical_score', 0):>5.1f}% x {int(hybrid_data.get('lexical_weight', 0)*100):>2}% = {hybrid_data.get('lexical_contribution', 0):>5.1f}\n")
 
             if hybrid_data.get('semantic_available', False):
-                report += f"    Semantic:  {hybrid_data.get('semantic_score', 0):>5.1f}% x {int(hybrid_data.get('semantic_weight', 0)*100):>2}% = {hybrid_data.get('semantic_contribution', 0):>5.1f}\n"
+                report_parts.append(f"    Semantic:  {hybrid_data.get('semantic_score', 0):>5.1f}% x {int(hybrid_data.get('semantic_weight', 0)*100):>2}% = {hybrid_data.get('semantic_contribution', 0):>5.1f}\n")
             else:
-                report += "    Semantic:  (unavailable - install sentence-transformers)\n"
+                report_parts.append("    Semantic:  (unavailable - install sentence-transformers)\n")
 
-            report += f"    Evidence:  {hybrid_data.get('evidence_score', 0):>5.1f}% x {int(hybrid_data.get('evidence_weight', 0)*100):>2}% = {hybrid_data.get('evidence_contribution', 0):>5.1f}\n"
+            report_parts.append(f"    Evidence:  {hybrid_data.get('evidence_score', 0):>5.1f}% x {int(hybrid_data.get('evidence_weight', 0)*100):>2}% = {hybrid_data.get('evidence_contribution', 0):>5.1f}\n")
 
         # Semantic Match Analysis (Track 2.8.2)
         if semantic_data and semantic_data.get('available', False):
-            report += """
+            report_parts.append("""
 --------------------------------------------------------------------------------
                    SEMANTIC MATCH ANALYSIS (Track 2.8.2)
 --------------------------------------------------------------------------------
-"""
+""")
             top_matches = semantic_data.get('top_matches', [])
             if top_matches:
-                report += "  Top Semantic Matches:\n"
+                report_parts.append("  Top Semantic Matches:\n")
                 for i, match in enumerate(top_matches[:5], 1):
                     hv_tag = " [HIGH-VALUE]" if match.get('is_high_value') else ""
-                    report += f"    {i}. {match.get('jd_section', '?')} <-> {match.get('cv_section', '?')}: {match.get('similarity', 0):.0f}%{hv_tag}\n"
+                    report_parts.append(f"    {i}. {match.get('jd_section', '?')} <-> {match.get('cv_section', '?')}: {match.get('similarity', 0):.0f}%{hv_tag}\n")
 
             gaps = semantic_data.get('gaps', [])
             if gaps:
-                report += "\n  Semantic Gaps:\n"
+                report_parts.append("\n  Semantic Gaps:\n")
                 for gap in gaps[:3]:
-                    report += f"    - {gap}\n"
+                    report_parts.append(f"    - {gap}\n")
 
             section_sims = semantic_data.get('section_similarities', {})
             if section_sims:
-                report += "\n  Section Similarity Scores:\n"
+                report_parts.append("\n  Section Similarity Scores:\n")
                 for section, sim in section_sims.items():
-                    report += f"    - {section}: {sim:.0f}%\n"
+                    report_parts.append(f"    - {section}: {sim:.0f}%\n")
 
         # Category score table
-        report += """
+        report_parts.append("""
 --------------------------------------------------------------------------------
                            SCORE BY CATEGORY
 --------------------------------------------------------------------------------
   Category                    | Match  | Score | Top Missing
   ----------------------------|--------|-------|-----------------------------
-"""
+""")
         for cat, label in category_labels.items():
             data = ats_score['scores_by_category'].get(cat, {})
             matched = data.get('matched', 0)
@@ -1512,44 +1938,44 @@ Generate the complete CV now:"""
             if total > 0:
                 pct = round(matched / total * 100)
                 missing_items = ', '.join(data.get('items_missing', [])[:2]) or '-'
-                report += f"  {label:<27} | {matched:>2}/{total:<2}  | {pct:>3}%  | {missing_items[:28]}\n"
+                report_parts.append(f"  {label:<27} | {matched:>2}/{total:<2}  | {pct:>3}%  | {missing_items[:28]}\n")
 
         # Keywords table
-        report += """
+        report_parts.append("""
 --------------------------------------------------------------------------------
                          KEYWORD MATCHING TABLE
 --------------------------------------------------------------------------------
-"""
+""")
         # Create side-by-side matched vs missing
         matched_kw = ats_score['matched_keywords']
         missing_kw = ats_score['missing_keywords']
         max_rows = max(len(matched_kw), len(missing_kw), 1)
 
-        report += "  MATCHED (in your CV)           | MISSING (consider adding)\n"
-        report += "  -------------------------------|--------------------------------\n"
+        report_parts.append("  MATCHED (in your CV)           | MISSING (consider adding)\n")
+        report_parts.append("  -------------------------------|--------------------------------\n")
 
         for i in range(min(max_rows, 12)):
             m = matched_kw[i] if i < len(matched_kw) else ''
             n = missing_kw[i] if i < len(missing_kw) else ''
-            report += f"  {m:<31} | {n}\n"
+            report_parts.append(f"  {m:<31} | {n}\n")
 
         # Phrases table
         matched_phrases = ats_score.get('matched_phrases', [])
         missing_phrases = ats_score.get('missing_phrases', [])
 
         if matched_phrases or missing_phrases:
-            report += """
+            report_parts.append("""
 --------------------------------------------------------------------------------
                        KEY PHRASES (2-word terms)
 --------------------------------------------------------------------------------
   MATCHED PHRASES              | MISSING PHRASES
   -----------------------------|--------------------------------
-"""
+""")
             max_phrase_rows = max(len(matched_phrases), len(missing_phrases), 1)
             for i in range(min(max_phrase_rows, 8)):
                 mp = matched_phrases[i] if i < len(matched_phrases) else ''
                 np = missing_phrases[i] if i < len(missing_phrases) else ''
-                report += f"  {mp:<29} | {np}\n"
+                report_parts.append(f"  {mp:<29} | {np}\n")
 
         # Section Analysis (Track 2.8)
         section_data = ats_score.get('section_analysis', {})
@@ -1557,75 +1983,75 @@ Generate the complete CV now:"""
         entities_data = ats_score.get('parsed_entities', {})
 
         if section_data:
-            report += """
+            report_parts.append("""
 --------------------------------------------------------------------------------
                     SECTION-LEVEL ANALYSIS (Track 2.8)
 --------------------------------------------------------------------------------
-"""
+""")
             exp_matches = section_data.get('experience_matches', [])
             skills_matches = section_data.get('skills_matches', [])
             not_found = section_data.get('not_found_in_cv', [])
 
-            report += f"  CV Sections Detected: {section_data.get('cv_sections_detected', 0)}\n"
-            report += f"  JD Sections Detected: {section_data.get('jd_sections_detected', 0)}\n\n"
+            report_parts.append(f"  CV Sections Detected: {section_data.get('cv_sections_detected', 0)}\n")
+            report_parts.append(f"  JD Sections Detected: {section_data.get('jd_sections_detected', 0)}\n\n")
 
             if exp_matches:
-                report += f"  Skills demonstrated in EXPERIENCE: {', '.join(exp_matches[:6])}\n"
+                report_parts.append(f"  Skills demonstrated in EXPERIENCE: {', '.join(exp_matches[:6])}\n")
             if skills_matches:
-                report += f"  Skills listed in SKILLS section:   {', '.join(skills_matches[:6])}\n"
+                report_parts.append(f"  Skills listed in SKILLS section:   {', '.join(skills_matches[:6])}\n")
             if not_found:
-                report += f"  Skills NOT found in CV:            {', '.join(not_found[:6])}\n"
+                report_parts.append(f"  Skills NOT found in CV:            {', '.join(not_found[:6])}\n")
 
         if evidence_data:
-            report += f"""
+            report_parts.append(f"""
   Evidence Strength Analysis:
     - Strong evidence (with metrics/context): {evidence_data.get('strong_evidence_count', 0)} skills
     - Moderate evidence:                      {evidence_data.get('moderate_evidence_count', 0)} skills
     - Weak evidence (just listed):            {evidence_data.get('weak_evidence_count', 0)} skills
     - Average evidence strength:              {evidence_data.get('average_strength', 0)}
-"""
+""")
             strong = evidence_data.get('strong_skills', [])
             if strong:
-                report += f"    - Top demonstrated skills: {', '.join(strong[:4])}\n"
+                report_parts.append(f"    - Top demonstrated skills: {', '.join(strong[:4])}\n")
 
         if entities_data:
             years_cv = entities_data.get('cv_years_experience')
             years_jd = entities_data.get('jd_years_required')
             if years_cv or years_jd:
-                report += f"\n  Experience: CV shows {years_cv or '?'} years, JD requires {years_jd or '?'} years\n"
+                report_parts.append(f"\n  Experience: CV shows {years_cv or '?'} years, JD requires {years_jd or '?'} years\n")
 
         # AI-identified requirements
-        report += f"""
+        report_parts.append(f"""
 --------------------------------------------------------------------------------
                       AI-IDENTIFIED REQUIREMENTS
 --------------------------------------------------------------------------------
 {key_requirements}
-"""
+""")
 
         # Recommendations
-        report += """
+        report_parts.append("""
 --------------------------------------------------------------------------------
                           RECOMMENDATIONS
 --------------------------------------------------------------------------------
-"""
+""")
         if ats_score['score'] >= 80:
-            report += "  [EXCELLENT] Your CV has strong keyword coverage for this role.\n"
+            report_parts.append("  [EXCELLENT] Your CV has strong keyword coverage for this role.\n")
         elif ats_score['score'] >= 60:
-            report += "  [GOOD] Good coverage. Focus on adding missing REQUIRED keywords.\n"
+            report_parts.append("  [GOOD] Good coverage. Focus on adding missing REQUIRED keywords.\n")
         elif ats_score['score'] >= 40:
-            report += "  [FAIR] Moderate match. Review the missing keywords and phrases.\n"
+            report_parts.append("  [FAIR] Moderate match. Review the missing keywords and phrases.\n")
         else:
-            report += "  [LOW] Low match. Strongly recommend adding more keywords.\n"
+            report_parts.append("  [LOW] Low match. Strongly recommend adding more keywords.\n")
 
         cat_scores = ats_score['scores_by_category']
         if cat_scores.get('required', {}).get('missing', 0) > 0:
-            report += "  - PRIORITY: Add missing REQUIRED skills\n"
+            report_parts.append("  - PRIORITY: Add missing REQUIRED skills\n")
         if cat_scores.get('hard_skills', {}).get('missing', 0) > 2:
-            report += "  - Add more technical/hard skills from job description\n"
+            report_parts.append("  - Add more technical/hard skills from job description\n")
         if missing_phrases:
-            report += f"  - Add key phrases: {', '.join(missing_phrases[:3])}\n"
+            report_parts.append(f"  - Add key phrases: {', '.join(missing_phrases[:3])}\n")
 
-        report += """
+        report_parts.append("""
 --------------------------------------------------------------------------------
                       ATS FORMATTING CHECKLIST
 --------------------------------------------------------------------------------
@@ -1635,8 +2061,9 @@ Generate the complete CV now:"""
   [ ] Key skills listed prominently
   [ ] Dates in standard format (Month Year)
 ================================================================================
-"""
+""")
 
+        report = ''.join(report_parts)
         return report, key_requirements, ats_score
 
 
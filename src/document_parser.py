@@ -8,10 +8,11 @@ Enables section-level matching and evidence-weighted scoring.
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from entity_taxonomy import (
-    HARD_SKILLS, SOFT_SKILLS, CERTIFICATIONS, METHODOLOGIES, DOMAINS,
+    HARD_SKILLS, SOFT_SKILLS, CERTIFICATIONS, METHODOLOGIES, DOMAINS, ALL_ENTITIES,
     JOB_TITLE_PATTERNS, YEARS_EXPERIENCE_PATTERNS,
     ACTION_VERBS, METRIC_PATTERNS
 )
@@ -61,7 +62,7 @@ class EntityType(Enum):
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """An extracted entity with context."""
     text: str
@@ -69,14 +70,19 @@ class Entity:
     section: Optional[str] = None
     evidence_strength: float = 1.0
     context: str = ""  # Surrounding text for context
+    # Lowercased text, computed once so scorers don't re-lower on every pass
+    text_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.text_lower = self.text.lower()
 
     def __hash__(self):
-        return hash((self.text.lower(), self.entity_type))
+        return hash((self.text_lower, self.entity_type))
 
     def __eq__(self, other):
         if not isinstance(other, Entity):
             return False
-        return self.text.lower() == other.text.lower() and self.entity_type == other.entity_type
+        return self.text_lower == other.text_lower and self.entity_type == other.entity_type
 
 
 @dataclass
@@ -109,11 +115,11 @@ class ParsedCV:
 
     def get_hard_skills(self) -> set[str]:
         """Get unique hard skills."""
-        return {e.text.lower() for e in self.entities if e.entity_type == EntityType.HARD_SKILL}
+        return {e.text_lower for e in self.entities if e.entity_type == EntityType.HARD_SKILL}
 
     def get_soft_skills(self) -> set[str]:
         """Get unique soft skills."""
-        return {e.text.lower() for e in self.entities if e.entity_type == EntityType.SOFT_SKILL}
+        return {e.text_lower for e in self.entities if e.entity_type == EntityType.SOFT_SKILL}
 
 
 @dataclass
@@ -133,14 +139,28 @@ class ParsedJD:
 
     def get_required_skills(self) -> set[str]:
         """Get required hard and soft skills."""
-        return {e.text.lower() for e in self.required_entities
+        return {e.text_lower for e in self.required_entities
                 if e.entity_type in (EntityType.HARD_SKILL, EntityType.SOFT_SKILL)}
 
     def get_preferred_skills(self) -> set[str]:
         """Get preferred/nice-to-have skills."""
-        return {e.text.lower() for e in self.preferred_entities
+        return {e.text_lower for e in self.preferred_entities
                 if e.entity_type in (EntityType.HARD_SKILL, EntityType.SOFT_SKILL)}
 
+    @cached_property
+    def required_or_preferred_texts(self) -> frozenset[str]:
+        """Lowercased text of all required and preferred entities (computed once)."""
+        return frozenset(
+            {e.text_lower for e in self.required_entities} |
+            {e.text_lower for e in self.preferred_entities}
+        )
+
+    @cached_property
+    def skill_texts(self) -> frozenset[str]:
+        """Lowercased hard and soft skills across all entities (computed once)."""
+        return frozenset(e.text_lower for e in self.entities
+                         if e.entity_type in (EntityType.HARD_SKILL, EntityType.SOFT_SKILL))
+
 
 # =============================================================================
 # SECTION DETECTOR
@@ -261,16 +281,22 @@ class SectionDetector:
         ],
     }
 
-    def __init__(self):
-        # Compile patterns for efficiency
-        self._cv_compiled = {
-            section_type: [re.compile(p, re.IGNORECASE) for p in patterns]
-            for section_type, patterns in self.CV_SECTION_PATTERNS.items()
-        }
-        self._jd_compiled = {
-            section_type: [re.compile(p, re.IGNORECASE) for p in patterns]
-            for section_type, patterns in self.JD_SECTION_PATTERNS.items()
-        }
+    # Header line heuristics: leading number/bullet, and typical section
+    # words anywhere in the lowercased line (substring match, no boundaries)
+    _BULLET_RE = re.compile(r'^[\d\.\-\*\u2022]\s*')
+    _SECTION_INDICATOR_RE = re.compile(
+        'summary|experience|education|skills|responsibilities|requirements|qualifications'
+    )
+
+    # Compiled once at import and shared by every detector
+    _cv_compiled = {
+        section_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+        for section_type, patterns in CV_SECTION_PATTERNS.items()
+    }
+    _jd_compiled = {
+        section_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+        for section_type, patterns in JD_SECTION_PATTERNS.items()
+    }
 
     def _is_header_line(self, line: str) -> bool:
         """Check if a line looks like a section header."""
@@ -287,24 +313,19 @@ class SectionDetector:
         if word_count > 6:
             return False
 
-        # All caps or title case
-        if stripped.isupper():
-            return True
-        if stripped.istitle() and word_count <= 4:
+        # Ends with colon, or all caps
+        if stripped[-1] == ':' or stripped.isupper():
             return True
 
-        # Ends with colon
-        if stripped.endswith(':'):
+        # Title case, or starts with number/bullet, if short enough (word
+        # count first so the string scans only run on short lines)
+        if word_count <= 4 and stripped.istitle():
             return True
-
-        # Starts with number/bullet but is short
-        if re.match(r'^[\d\.\-\*\u2022]\s*', stripped) and word_count <= 3:
+        if word_count <= 3 and self._BULLET_RE.match(stripped):
             return True
 
         # Contains typical section words
-        section_indicators = ['summary', 'experience', 'education', 'skills',
-                            'responsibilities', 'requirements', 'qualifications']
-        if any(ind in stripped.lower() for ind in section_indicators):
+        if self._SECTION_INDICATOR_RE.search(stripped.lower()):
             return True
 
         return False
@@ -317,17 +338,18 @@ class SectionDetector:
                     return section_type
         return None
 
-    def detect_cv_sections(self, text: str) -> list[Section]:
-        """Detect sections in a CV."""
-        lines = text.split('\n')
+    def _detect_sections(self, lines: list[str], compiled_patterns: dict,
+                         unknown_type: Enum) -> list[Section]:
+        """Split pre-split lines into sections at recognised header lines."""
         sections = []
         current_section = None
         current_content = []
         current_start = 0
+        current_title = lines[0].strip() if lines else ""
 
         for i, line in enumerate(lines):
             if self._is_header_line(line):
-                section_type = self._match_section_type(line, self._cv_compiled)
+                section_type = self._match_section_type(line, compiled_patterns)
 
                 # Only start a new section if we match a known section type
                 # This prevents job titles and company names from fragmenting sections
@@ -335,8 +357,8 @@ class SectionDetector:
                     # Save previous section
                     if current_section is not None or current_content:
                         sections.append(Section(
-                            section_type=current_section or CVSectionType.UNKNOWN,
-                            title=lines[current_start].strip() if current_start < len(lines) else "",
+                            section_type=current_section or unknown_type,
+                            title=current_title,
                             content='\n'.join(current_content),
                             start_line=current_start,
                             end_line=i - 1
@@ -346,6 +368,7 @@ class SectionDetector:
                     current_section = section_type
                     current_content = []
                     current_start = i
+                    current_title = line.strip()
                 else:
                     # Header-like line but not a known section - keep as content
                     current_content.append(line)
@@ -355,8 +378,8 @@ class SectionDetector:
         # Don't forget the last section
         if current_content or current_section:
             sections.append(Section(
-                section_type=current_section or CVSectionType.UNKNOWN,
-                title=lines[current_start].strip() if current_start < len(lines) else "",
+                section_type=current_section or unknown_type,
+                title=current_title,
                 content='\n'.join(current_content),
                 start_line=current_start,
                 end_line=len(lines) - 1
@@ -364,86 +387,159 @@ class SectionDetector:
 
         return sections
 
+    def detect_cv_sections(self, text: str) -> list[Section]:
+        """Detect sections in a CV."""
+        return self._detect_sections(text.split('\n'), self._cv_compiled, CVSectionType.UNKNOWN)
+
     def detect_jd_sections(self, text: str) -> list[Section]:
         """Detect sections in a job description."""
-        lines = text.split('\n')
-        sections = []
-        current_section = None
-        current_content = []
-        current_start = 0
-
-        for i, line in enumerate(lines):
-            if self._is_header_line(line):
-                section_type = self._match_section_type(line, self._jd_compiled)
-
-                if section_type:
-                    # Save previous section
-                    if current_section is not None or current_content:
-                        sections.append(Section(
-                            section_type=current_section or JDSectionType.UNKNOWN,
-                            title=lines[current_start].strip() if current_start < len(lines) else "",
-                            content='\n'.join(current_content),
-                            start_line=current_start,
-                            end_line=i - 1
-                        ))
-
-                    # Start new section
-                    current_section = section_type
-                    current_content = []
-                    current_start = i
-                else:
-                    current_content.append(line)
-            else:
-                current_content.append(line)
-
-        # Don't forget the last section
-        if current_content or current_section:
-            sections.append(Section(
-                section_type=current_section or JDSectionType.UNKNOWN,
-                title=lines[current_start].strip() if current_start < len(lines) else "",
-                content='\n'.join(current_content),
-                start_line=current_start,
-                end_line=len(lines) - 1
-            ))
-
-        return sections
+        return self._detect_sections(text.split('\n'), self._jd_compiled, JDSectionType.UNKNOWN)
 
 
 # =============================================================================
 # ENTITY EXTRACTOR
 # =============================================================================
 
+@dataclass(frozen=True)
+class _TermMatcher:
+    """Compiled taxonomy matcher shared by every EntityExtractor."""
+    pattern: re.Pattern  # IGNORECASE alternation over all terms
+    lowercase_pattern: re.Pattern  # Same alternation, for pre-lowercased text
+    terms_by_key: dict[str, str]  # Lookup key -> taxonomy term
+    term_prefixes: dict[str, list[str]]  # Term -> shorter terms that prefix it
+    prefix_patterns: dict[str, re.Pattern]
+    lowercase_prefix_patterns: dict[str, re.Pattern]
+    taxonomy_positions: dict[EntityType, dict[str, int]]  # Per-type iteration order
+
+
 class EntityExtractor:
     """Rule-based entity extraction from taxonomy."""
 
+    # Job title, experience, metric and action verb patterns, compiled once
+    _title_patterns = [re.compile(p, re.IGNORECASE) for p in JOB_TITLE_PATTERNS]
+    _exp_patterns = [re.compile(p, re.IGNORECASE) for p in YEARS_EXPERIENCE_PATTERNS]
+    # Case-sensitive copies for text that _lowercase_view has lowercased
+    _lowercase_title_patterns = [re.compile(p) for p in JOB_TITLE_PATTERNS]
+    _lowercase_exp_patterns = [re.compile(p) for p in YEARS_EXPERIENCE_PATTERNS]
+    _metric_patterns = [re.compile(p, re.IGNORECASE) for p in METRIC_PATTERNS]
+    # ACTION_VERBS is a set: sort (longest first) so the pattern is the same
+    # every run, and escape in case a verb ever carries a regex metacharacter
+    _action_verb_pattern = re.compile(
+        r'\b(?:' + '|'.join(re.escape(verb) for verb in
+                             sorted(ACTION_VERBS, key=lambda verb: (-len(verb), verb))) + r')\b',
+        re.IGNORECASE
+    )
+
+    # Characters IGNORECASE matches to an ASCII letter that str.lower() doesn't map to it
+    _CASE_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's'})
+
     def __init__(self):
-        # Pre-compile patterns for multi-word terms
-        self._skill_patterns = {}
-        for skill in HARD_SKILLS | SOFT_SKILLS:
-            # Escape special regex chars and create word-boundary pattern
-            escaped = re.escape(skill)
-            self._skill_patterns[skill] = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-
-        for cert in CERTIFICATIONS:
-            escaped = re.escape(cert)
-            self._skill_patterns[cert] = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-
-        for method in METHODOLOGIES:
-            escaped = re.escape(method)
-            self._skill_patterns[method] = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-
-        for domain in DOMAINS:
-            escaped = re.escape(domain)
-            self._skill_patterns[domain] = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-
-        # Compile job title and experience patterns
-        self._title_patterns = [re.compile(p, re.IGNORECASE) for p in JOB_TITLE_PATTERNS]
-        self._exp_patterns = [re.compile(p, re.IGNORECASE) for p in YEARS_EXPERIENCE_PATTERNS]
-        self._metric_patterns = [re.compile(p, re.IGNORECASE) for p in METRIC_PATTERNS]
-        self._action_verb_pattern = re.compile(
-            r'\b(' + '|'.join(ACTION_VERBS) + r')\b', re.IGNORECASE
+        # The taxonomy matcher is built on first use and shared by all instances
+        self._matcher = self._build_term_matcher()
+
+    @classmethod
+    def _term_key(cls, text: str) -> str:
+        """Lookup key for a taxonomy term or any text IGNORECASE matched to it."""
+        return text.translate(cls._CASE_FOLD).lower()
+
+    @staticmethod
+    def _lowercase_view(text: str) -> Optional[str]:
+        """Return text.lower() if case-sensitive patterns over it find the same
+        spans as IGNORECASE patterns over text, else None.
+
+        That holds when lowercasing keeps every offset and no character that
+        only IGNORECASE folds onto an ASCII letter (dotless i, long s) occurs.
+        Case-sensitive matching is several times faster.
+        """
+        lowered = text.lower()
+        if len(lowered) == len(text) and '\u0131' not in text and '\u017f' not in text:
+            return lowered
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_term_matcher() -> '_TermMatcher':
+        """Compile the taxonomy matcher."""
+        # One alternation over the whole taxonomy, longest term first, inside a
+        # lookahead so every start position is tried and terms nested in a
+        # longer match (e.g. "sql" in "sql server") are not consumed
+        terms = ALL_ENTITIES
+        ordered = sorted(terms, key=lambda term: (-len(term), term))
+        alternation = '(?=(' + '|'.join(rf'\b{re.escape(term)}\b' for term in ordered) + '))'
+        terms_by_key = {EntityExtractor._term_key(term): term for term in terms}
+
+        # The alternation reports only the longest term at each position; shorter
+        # terms that are prefixes of it are re-checked with their own pattern
+        term_prefixes = {}
+        for key, term in terms_by_key.items():
+            prefixes = [terms_by_key[key[:i]] for i in range(len(key) - 1, 0, -1)
+                        if key[:i] in terms_by_key]
+            if prefixes:
+                term_prefixes[term] = prefixes
+        prefix_sources = {
+            prefix: rf'\b{re.escape(prefix)}\b'
+            for prefixes in term_prefixes.values() for prefix in prefixes
+        }
+
+        # Position of each term in its taxonomy's iteration order, so matches
+        # can be emitted in that order without walking the whole taxonomy
+        taxonomy_positions = {
+            entity_type: {term: i for i, term in enumerate(taxonomy)}
+            for entity_type, taxonomy in (
+                (EntityType.HARD_SKILL, HARD_SKILLS),
+                (EntityType.SOFT_SKILL, SOFT_SKILLS),
+                (EntityType.CERTIFICATION, CERTIFICATIONS),
+                (EntityType.METHODOLOGY, METHODOLOGIES),
+                (EntityType.DOMAIN, DOMAINS),
+            )
+        }
+
+        return _TermMatcher(
+            pattern=re.compile(alternation, re.IGNORECASE),
+            lowercase_pattern=re.compile(alternation),
+            terms_by_key=terms_by_key,
+            term_prefixes=term_prefixes,
+            prefix_patterns={
+                prefix: re.compile(source, re.IGNORECASE)
+                for prefix, source in prefix_sources.items()
+            },
+            lowercase_prefix_patterns={
+                prefix: re.compile(source) for prefix, source in prefix_sources.items()
+            },
+            taxonomy_positions=taxonomy_positions,
         )
 
+    def _find_terms(self, text: str,
+                    regions: Optional[list[tuple[int, int]]] = None) -> dict[str, tuple[int, int]]:
+        """Map each taxonomy term found in text (or in the given character
+        regions of it) to the span of its first match."""
+        matcher = self._matcher
+        haystack = self._lowercase_view(text)
+        if haystack is not None:
+            pattern, prefix_patterns = matcher.lowercase_pattern, matcher.lowercase_prefix_patterns
+        else:
+            haystack = text
+            pattern, prefix_patterns = matcher.pattern, matcher.prefix_patterns
+
+        found = {}
+        for region_start, region_end in regions if regions is not None else [(0, len(text))]:
+            for match in pattern.finditer(haystack, region_start, region_end):
+                start = match.start()
+                term = matcher.terms_by_key[self._term_key(match.group(1))]
+                if term not in found:
+                    found[term] = (start, match.end(1))
+                for prefix in matcher.term_prefixes.get(term, ()):
+                    if prefix not in found:
+                        prefix_match = prefix_patterns[prefix].match(haystack, start, region_end)
+                        if prefix_match:
+                            found[prefix] = prefix_match.span()
+        return found
+
+    def _matched_terms(self, found: dict[str, tuple[int, int]], entity_type: EntityType) -> list[str]:
+        """Terms of one taxonomy present in found, in taxonomy order."""
+        positions = self._matcher.taxonomy_positions[entity_type]
+        return sorted((term for term in found if term in positions), key=positions.__getitem__)
+
     def _get_context(self, text: str, match_start: int, match_end: int, window: int = 50) -> str:
         """Get surrounding context for a match."""
         start = max(0, match_start - window)
@@ -478,115 +574,127 @@ class EntityExtractor:
 
         return min(strength, 2.0)  # Cap at 2.0
 
-    def extract_entities(self, text: str, section_type: Optional[Enum] = None) -> list[Entity]:
-        """Extract all entities from text."""
+    def extract_entities(self, text: str, section_type: Optional[Enum] = None,
+                         regions: Optional[list[tuple[int, int]]] = None) -> list[Entity]:
+        """Extract all entities from text.
+
+        If regions (character spans) is given, only matches inside them are
+        taken; context and evidence strength still come from the whole text.
+        """
         entities = []
         seen = set()  # Track (text_lower, entity_type) to avoid duplicates
+        found = self._find_terms(text, regions)
 
         # Extract hard skills
-        for skill in HARD_SKILLS:
-            pattern = self._skill_patterns.get(skill)
-            if pattern:
-                for match in pattern.finditer(text):
-                    key = (skill.lower(), EntityType.HARD_SKILL)
-                    if key not in seen:
-                        seen.add(key)
-                        strength = self._calculate_evidence_strength(
-                            text, section_type, match.start(), match.end()
-                        )
-                        entities.append(Entity(
-                            text=match.group(),
-                            entity_type=EntityType.HARD_SKILL,
-                            section=section_type.value if section_type else None,
-                            evidence_strength=strength,
-                            context=self._get_context(text, match.start(), match.end())
-                        ))
+        for skill in self._matched_terms(found, EntityType.HARD_SKILL):
+            start, end = found[skill]
+            key = (skill.lower(), EntityType.HARD_SKILL)
+            if key not in seen:
+                seen.add(key)
+                strength = self._calculate_evidence_strength(
+                    text, section_type, start, end
+                )
+                entities.append(Entity(
+                    text=text[start:end],
+                    entity_type=EntityType.HARD_SKILL,
+                    section=section_type.value if section_type else None,
+                    evidence_strength=strength,
+                    context=self._get_context(text, start, end)
+                ))
 
         # Extract soft skills
-        for skill in SOFT_SKILLS:
-            pattern = self._skill_patterns.get(skill)
-            if pattern:
-                for match in pattern.finditer(text):
-                    key = (skill.lower(), EntityType.SOFT_SKILL)
-                    if key not in seen:
-                        seen.add(key)
-                        strength = self._calculate_evidence_strength(
-                            text, section_type, match.start(), match.end()
-                        )
-                        entities.append(Entity(
-                            text=match.group(),
-                            entity_type=EntityType.SOFT_SKILL,
-                            section=section_type.value if section_type else None,
-                            evidence_strength=strength,
-                            context=self._get_context(text, match.start(), match.end())
-                        ))
+        for skill in self._matched_terms(found, EntityType.SOFT_SKILL):
+            start, end = found[skill]
+            key = (skill.lower(), EntityType.SOFT_SKILL)
+            if key not in seen:
+                seen.add(key)
+                strength = self._calculate_evidence_strength(
+                    text, section_type, start, end
+                )
+                entities.append(Entity(
+                    text=text[start:end],
+                    entity_type=EntityType.SOFT_SKILL,
+                    section=section_type.value if section_type else None,
+                    evidence_strength=strength,
+                    context=self._get_context(text, start, end)
+                ))
 
         # Extract certifications
-        for cert in CERTIFICATIONS:
-            pattern = self._skill_patterns.get(cert)
-            if pattern:
-                for match in pattern.finditer(text):
-                    key = (cert.lower(), EntityType.CERTIFICATION)
-                    if key not in seen:
-                        seen.add(key)
-                        entities.append(Entity(
-                            text=match.group(),
-                            entity_type=EntityType.CERTIFICATION,
-                            section=section_type.value if section_type else None,
-                            evidence_strength=1.5,  # Certifications are strong evidence
-                            context=self._get_context(text, match.start(), match.end())
-                        ))
+        for cert in self._matched_terms(found, EntityType.CERTIFICATION):
+            start, end = found[cert]
+            key = (cert.lower(), EntityType.CERTIFICATION)
+            if key not in seen:
+                seen.add(key)
+                entities.append(Entity(
+                    text=text[start:end],
+                    entity_type=EntityType.CERTIFICATION,
+                    section=section_type.value if section_type else None,
+                    evidence_strength=1.5,  # Certifications are strong evidence
+                    context=self._get_context(text, start, end)
+                ))
 
         # Extract methodologies
-        for method in METHODOLOGIES:
-            pattern = self._skill_patterns.get(method)
-            if pattern:
-                for match in pattern.finditer(text):
-                    key = (method.lower(), EntityType.METHODOLOGY)
-                    if key not in seen:
-                        seen.add(key)
-                        entities.append(Entity(
-                            text=match.group(),
-                            entity_type=EntityType.METHODOLOGY,
-                            section=section_type.value if section_type else None,
-                            evidence_strength=1.0,
-                            context=self._get_context(text, match.start(), match.end())
-                        ))
+        for method in self._matched_terms(found, EntityType.METHODOLOGY):
+            start, end = found[method]
+            key = (method.lower(), EntityType.METHODOLOGY)
+            if key not in seen:
+                seen.add(key)
+                entities.append(Entity(
+                    text=text[start:end],
+                    entity_type=EntityType.METHODOLOGY,
+                    section=section_type.value if section_type else None,
+                    evidence_strength=1.0,
+                    context=self._get_context(text, start, end)
+                ))
 
         # Extract domains
-        for domain in DOMAINS:
-            pattern = self._skill_patterns.get(domain)
-            if pattern:
-                for match in pattern.finditer(text):
-                    key = (domain.lower(), EntityType.DOMAIN)
-                    if key not in seen:
-                        seen.add(key)
-                        entities.append(Entity(
-                            text=match.group(),
-                            entity_type=EntityType.DOMAIN,
-                            section=section_type.value if section_type else None,
-                            evidence_strength=1.0,
-                            context=self._get_context(text, match.start(), match.end())
-                        ))
+        for domain in self._matched_terms(found, EntityType.DOMAIN):
+            start, end = found[domain]
+            key = (domain.lower(), EntityType.DOMAIN)
+            if key not in seen:
+                seen.add(key)
+                entities.append(Entity(
+                    text=text[start:end],
+                    entity_type=EntityType.DOMAIN,
+                    section=section_type.value if section_type else None,
+                    evidence_strength=1.0,
+                    context=self._get_context(text, start, end)
+                ))
 
         return entities
 
     def extract_job_titles(self, text: str) -> list[str]:
         """Extract job titles from text."""
         titles = []
-        for pattern in self._title_patterns:
-            for match in pattern.finditer(text):
-                title = match.group().strip()
-                if title.lower() not in [t.lower() for t in titles]:
+        seen = set()  # Lowercased titles already taken
+        haystack = self._lowercase_view(text)
+        if haystack is not None:
+            patterns = self._lowercase_title_patterns
+        else:
+            haystack, patterns = text, self._title_patterns
+
+        for pattern in patterns:
+            for match in pattern.finditer(haystack):
+                start, end = match.span()
+                # Slice the original text so titles keep their casing
+                title = text[start:end].strip()
+                title_lower = title.lower()
+                if title_lower not in seen:
+                    seen.add(title_lower)
                     titles.append(title)
         return titles
 
     def extract_years_experience(self, text: str) -> Optional[int]:
         """Extract years of experience from text."""
         max_years = None
-
-        for pattern in self._exp_patterns:
-            for match in pattern.finditer(text):
+        haystack = self._lowercase_view(text)
+        if haystack is not None:
+            patterns = self._lowercase_exp_patterns
+        else:
+            haystack, patterns = text, self._exp_patterns
+
+        for pattern in patterns:
+            for match in pattern.finditer(haystack):
                 groups = match.groups()
                 for group in groups:
                     if group and group.isdigit():
@@ -608,6 +716,21 @@ class DocumentParser:
         self.section_detector = SectionDetector()
         self.entity_extractor = EntityExtractor()
 
+    @staticmethod
+    def _header_spans(text: str, sections: list[Section]) -> list[tuple[int, int]]:
+        """Character spans of the header lines that open the detected sections."""
+        header_lines = {
+            section.start_line for section in sections
+            if section.section_type not in (CVSectionType.UNKNOWN, JDSectionType.UNKNOWN)
+        }
+        spans = []
+        offset = 0
+        for i, line in enumerate(text.split('\n')):
+            if i in header_lines:
+                spans.append((offset, offset + len(line)))
+            offset += len(line) + 1
+        return spans
+
     def parse_cv(self, text: str) -> ParsedCV:
         """Parse a CV into structured format."""
         # Detect sections
@@ -622,10 +745,15 @@ class DocumentParser:
             section.entities = section_entities
             all_entities.extend(section_entities)
 
-        # Also extract from full text for any missed entities
-        full_text_entities = self.entity_extractor.extract_entities(text)
-        for entity in full_text_entities:
-            if entity not in all_entities:
+        # Section headers aren't part of any section's content; pick up
+        # entities that only appear there
+        header_entities = self.entity_extractor.extract_entities(
+            text, regions=self._header_spans(text, sections)
+        )
+        known = set(all_entities)  # Entity hashes on (text_lower, entity_type)
+        for entity in header_entities:
+            if entity not in known:
+                known.add(entity)
                 all_entities.append(entity)
 
         # Extract job titles and years of experience
@@ -663,10 +791,15 @@ class DocumentParser:
             elif section.section_type == JDSectionType.PREFERRED:
                 preferred_entities.extend(section_entities)
 
-        # Also extract from full text
-        full_text_entities = self.entity_extractor.extract_entities(text)
-        for entity in full_text_entities:
-            if entity not in all_entities:
+        # Section headers aren't part of any section's content; pick up
+        # entities that only appear there
+        header_entities = self.entity_extractor.extract_entities(
+            text, regions=self._header_spans(text, sections)
+        )
+        known = set(all_entities)  # Entity hashes on (text_lower, entity_type)
+        for entity in header_entities:
+            if entity not in known:
+                known.add(entity)
                 all_entities.append(entity)
 
         # Extract job title and years required
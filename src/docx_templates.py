@@ -18,7 +18,13 @@ CRITICAL ATS REQUIREMENTS (Non-Negotiable):
 12. Consistent date format (Month YYYY)
 """
 
+import atexit
+import hashlib
+import json
 import re
+import subprocess
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 
@@ -62,12 +68,14 @@ def parse_markdown_cv(md_content: str) -> dict:
             data['title'] = line.strip('*').strip()
             continue
         
-        # Contact info (emails, phones, links)
-        if any(indicator in line.lower() for indicator in ['@', 'phone', 'linkedin', 'github', '|']):
-            if not any(s in line for s in ['##', '###', '-', '•']):
-                contact_parts = [p.strip() for p in line.split('|')]
-                data['contact'].extend(contact_parts)
-                continue
+        # Contact info (emails, phones, links). Headings and bullets are ruled
+        # out first: those substring tests are cheaper than lowercasing the
+        # line, and most CV lines are headings or bullets
+        if ('-' not in line and '•' not in line and '##' not in line
+                and any(indicator in line.lower() for indicator in ['@', 'phone', 'linkedin', 'github', '|'])):
+            contact_parts = [p.strip() for p in line.split('|')]
+            data['contact'].extend(contact_parts)
+            continue
         
         # H2 - Major sections
         if line.startswith('## '):
@@ -98,7 +106,7 @@ def parse_markdown_cv(md_content: str) -> dict:
             continue
         
         # Bullet points
-        if line.startswith('- ') or line.startswith('* ') or line.startswith('• '):
+        if line.startswith(('- ', '* ', '• ')):
             bullet_text = line[2:].strip() if line[0] in ['-', '*'] else line[1:].strip()
             
             if current_subsection:
@@ -126,6 +134,103 @@ def parse_markdown_cv(md_content: str) -> dict:
     return data
 
 
+# Lowercase openings of a cover letter's closing line
+_CLOSING_PREFIXES = ('sincerely', 'best regards', 'kind regards', 'yours')
+
+
+# Long-lived Node process that renders DOCX files (see docx_worker.js).
+# Started on first use so docx is loaded once per Python process rather than
+# once per document; calls are serialized over its stdin/stdout.
+_WORKER_SCRIPT = Path(__file__).with_name('docx_worker.js')
+_node_worker = None
+_node_worker_lock = threading.Lock()
+
+
+def _stop_node_worker():
+    """Shut down the Node worker if one was started"""
+    global _node_worker
+    with _node_worker_lock:
+        if _node_worker is not None:
+            _node_worker.terminate()
+            _node_worker.wait()
+            _node_worker = None
+
+
+atexit.register(_stop_node_worker)
+
+
+# JSON-encoded parse_markdown_cv results, keyed by a digest of the markdown,
+# so regenerating the same CV skips parsing and encoding
+_cv_payload_cache: OrderedDict = OrderedDict()
+_cv_payload_cache_lock = threading.Lock()
+_CV_PAYLOAD_CACHE_SIZE = 64
+
+
+def _cv_payload(cv_content: str) -> str:
+    """Return parse_markdown_cv(cv_content) as JSON, reusing earlier results"""
+    cache_key = hashlib.blake2b(cv_content.encode(), digest_size=16).digest()
+    with _cv_payload_cache_lock:
+        payload = _cv_payload_cache.get(cache_key)
+        if payload is not None:
+            _cv_payload_cache.move_to_end(cache_key)
+            return payload
+
+    payload = json.dumps(parse_markdown_cv(cv_content))
+
+    with _cv_payload_cache_lock:
+        _cv_payload_cache[cache_key] = payload
+        if len(_cv_payload_cache) > _CV_PAYLOAD_CACHE_SIZE:
+            _cv_payload_cache.popitem(last=False)
+
+    return payload
+
+
+def _render_docx(kind: str, payload: str, output_path: str, label: str):
+    """
+    Render one document through the Node worker, starting it if needed
+
+    Args:
+        kind: Template name in docx_worker.js ('cv' or 'cover_letter')
+        payload: JSON-encoded document content for the template
+        output_path: Path to save .docx file
+        label: Document name for error messages
+    """
+    global _node_worker
+    job = '{"kind": %s, "output": %s, "data": %s}' % (
+        json.dumps(kind), json.dumps(output_path), payload
+    )
+
+    with _node_worker_lock:
+        if _node_worker is None or _node_worker.poll() is not None:
+            _node_worker = subprocess.Popen(
+                ['node', str(_WORKER_SCRIPT)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, encoding='utf-8'
+            )
+        worker = _node_worker
+
+        try:
+            worker.stdin.write(job + '\n')
+            worker.stdin.flush()
+            reply = worker.stdout.readline()
+        except OSError:  # Worker already exited (e.g. docx not installed)
+            reply = ''
+
+        if not reply:
+            _node_worker = None
+            worker.kill()
+            error = worker.stderr.read()
+            worker.wait()
+        else:
+            result = json.loads(reply)
+            error = None if result['ok'] else result['error']
+
+    if error is not None:
+        print(f"❌ Error generating {label} DOCX:")
+        print(error)
+        raise RuntimeError(f"DOCX generation failed: {error}")
+
+
 def generate_cv_docx_node(cv_content: str, output_path: str):
     """
     Generate ATS-optimized CV in DOCX format using docx-js (Node.js)
@@ -136,240 +241,9 @@ def generate_cv_docx_node(cv_content: str, output_path: str):
     """
     
     # Parse markdown content
-    data = parse_markdown_cv(cv_content)
-    
-    # Escape backslashes for Windows paths in JavaScript strings
-    output_path_escaped = output_path.replace('\\', '\\\\')
-    
-    # Generate Node.js script to create DOCX
-    script = f'''
-const {{ Document, Packer, Paragraph, TextRun, AlignmentType, HeadingLevel, LevelFormat, WidthType }} = require('docx');
-const fs = require('fs');
-
-// ATS-OPTIMIZED CV TEMPLATE
-// Uses simple formatting, standard fonts, clear hierarchy
-// NO tables, NO graphics, NO complex layouts
-
-const doc = new Document({{
-  styles: {{
-    default: {{
-      document: {{
-        run: {{ font: "Calibri", size: 22 }} // 11pt body text
-      }}
-    }},
-    paragraphStyles: [
-      // Override built-in Title for name
-      {{
-        id: "Title",
-        name: "Title",
-        basedOn: "Normal",
-        run: {{ size: 36, bold: true, color: "000000", font: "Calibri" }}, // 18pt
-        paragraph: {{ spacing: {{ before: 0, after: 120 }}, alignment: AlignmentType.CENTER }}
-      }},
-      // Override Heading1 for section headers
-      {{
-        id: "Heading1",
-        name: "Heading 1",
-        basedOn: "Normal",
-        next: "Normal",
-        run: {{ size: 28, bold: true, color: "2E3B4E", font: "Calibri" }}, // 14pt, dark gray
-        paragraph: {{ 
-          spacing: {{ before: 240, after: 120 }},
-          outlineLevel: 0,
-          border: {{ bottom: {{ color: "CCCCCC", space: 1, style: "single", size: 6 }} }} // Subtle line
-        }}
-      }},
-      // Override Heading2 for job titles/education
-      {{
-        id: "Heading2",
-        name: "Heading 2",
-        basedOn: "Normal",
-        next: "Normal",
-        run: {{ size: 24, bold: true, color: "000000", font: "Calibri" }}, // 12pt
-        paragraph: {{ spacing: {{ before: 180, after: 60 }}, outlineLevel: 1 }}
-      }},
-      // Custom style for subtitle (professional title)
-      {{
-        id: "Subtitle",
-        name: "Subtitle",
-        basedOn: "Normal",
-        run: {{ size: 24, color: "666666", font: "Calibri" }}, // 12pt gray
-        paragraph: {{ spacing: {{ before: 60, after: 120 }}, alignment: AlignmentType.CENTER }}
-      }},
-      // Custom style for contact info
-      {{
-        id: "Contact",
-        name: "Contact",
-        basedOn: "Normal",
-        run: {{ size: 20, color: "666666", font: "Calibri" }}, // 10pt gray
-        paragraph: {{ spacing: {{ before: 0, after: 240 }}, alignment: AlignmentType.CENTER }}
-      }},
-      // Custom style for metadata (dates, locations)
-      {{
-        id: "Metadata",
-        name: "Metadata",
-        basedOn: "Normal",
-        run: {{ size: 20, italics: true, color: "666666", font: "Calibri" }}, // 10pt gray italic
-        paragraph: {{ spacing: {{ before: 0, after: 60 }} }}
-      }}
-    ]
-  }},
-  
-  numbering: {{
-    config: [
-      {{
-        reference: "cv-bullets",
-        levels: [
-          {{
-            level: 0,
-            format: LevelFormat.BULLET,
-            text: "•",
-            alignment: AlignmentType.LEFT,
-            style: {{
-              paragraph: {{
-                indent: {{ left: 720, hanging: 360 }} // Standard indent
-              }}
-            }}
-          }}
-        ]
-      }}
-    ]
-  }},
-  
-  sections: [{{
-    properties: {{
-      page: {{
-        margin: {{ top: 1080, right: 1080, bottom: 1080, left: 1080 }} // 0.75" margins
-      }}
-    }},
-    children: [
-      // NAME (Title style)
-      new Paragraph({{
-        heading: HeadingLevel.TITLE,
-        children: [new TextRun("{data['name']}")]
-      }}),
-      
-      // PROFESSIONAL TITLE (Subtitle style)
-      new Paragraph({{
-        style: "Subtitle",
-        children: [new TextRun("{data['title']}")]
-      }}),
-      
-      // CONTACT INFO (Contact style)
-'''
-    
-    # Add contact information
-    if data['contact']:
-        contact_text = " | ".join(data['contact'])
-        script += f'''
-      new Paragraph({{
-        style: "Contact",
-        children: [new TextRun("{contact_text}")]
-      }}),
-'''
-    
-    # Add sections
-    for section in data['sections']:
-        # Section header (H1)
-        section_title = section['title'].upper()  # ATS prefers uppercase section headers
-        script += f'''
-      
-      // SECTION: {section_title}
-      new Paragraph({{
-        heading: HeadingLevel.HEADING_1,
-        children: [new TextRun("{section_title}")]
-      }}),
-'''
-        
-        # Section content
-        for item in section['content']:
-            if item['type'] == 'subsection':
-                # Subsection title (H2) - job title, education
-                subsection_title = item['title'].replace('"', '\\"')
-                script += f'''
-      new Paragraph({{
-        heading: HeadingLevel.HEADING_2,
-        children: [new TextRun("{subsection_title}")]
-      }}),
-'''
-                
-                # Subsection details
-                for detail in item['details']:
-                    if detail['type'] == 'metadata':
-                        # Dates, locations (italic gray)
-                        metadata_text = detail['text'].replace('"', '\\"')
-                        script += f'''
-      new Paragraph({{
-        style: "Metadata",
-        children: [new TextRun("{metadata_text}")]
-      }}),
-'''
-                    elif detail['type'] == 'bullet':
-                        # Bullet point
-                        bullet_text = detail['text'].replace('"', '\\"')
-                        script += f'''
-      new Paragraph({{
-        numbering: {{ reference: "cv-bullets", level: 0 }},
-        children: [new TextRun("{bullet_text}")]
-      }}),
-'''
-                    elif detail['type'] == 'text':
-                        # Regular text
-                        text_content = detail['text'].replace('"', '\\"')
-                        script += f'''
-      new Paragraph({{
-        children: [new TextRun("{text_content}")]
-      }}),
-'''
-            
-            elif item['type'] == 'bullet':
-                # Direct bullet in section
-                bullet_text = item['text'].replace('"', '\\"')
-                script += f'''
-      new Paragraph({{
-        numbering: {{ reference: "cv-bullets", level: 0 }},
-        children: [new TextRun("{bullet_text}")]
-      }}),
-'''
-            
-            elif item['type'] == 'text':
-                # Regular paragraph
-                text_content = item['text'].replace('"', '\\"')
-                script += f'''
-      new Paragraph({{
-        children: [new TextRun("{text_content}")]
-      }}),
-'''
-    
-    # Close document structure
-    script += f'''
-    ]
-  }}]
-}});
-
-// Generate and save DOCX
-Packer.toBuffer(doc).then(buffer => {{
-  fs.writeFileSync("{output_path_escaped}", buffer);
-  console.log("✅ CV DOCX generated successfully: {output_path_escaped}");
-}});
-'''
+    payload = _cv_payload(cv_content)
     
-    # Save script to temporary file
-    script_path = Path(output_path).parent / "_generate_cv.js"
-    with open(script_path, 'w', encoding='utf-8') as f:
-        f.write(script)
-    
-    # Execute Node.js script
-    import subprocess
-    result = subprocess.run(['node', str(script_path)], capture_output=True, text=True)
-    
-    if result.returncode != 0:
-        print(f"❌ Error generating CV DOCX:")
-        print(result.stderr)
-        raise RuntimeError(f"DOCX generation failed: {result.stderr}")
-    
-    # Clean up script
-    script_path.unlink()
+    _render_docx('cv', payload, output_path, 'CV')
     
     print(f"✅ ATS-optimized CV created: {output_path}")
 
@@ -387,135 +261,37 @@ def generate_cover_letter_docx_node(letter_content: str, output_path: str, appli
     # Parse cover letter structure
     lines = [line.strip() for line in letter_content.strip().split('\n') if line.strip()]
     
+    # Closing lines ("Sincerely", "Kind regards", ...) precede the signature
+    closing = [line.lower().startswith(_CLOSING_PREFIXES) for line in lines]
+    
     # Try to extract name if not provided
     if not applicant_name:
         # Look for signature line
-        for i, line in enumerate(lines):
-            if line.lower().startswith(('sincerely', 'best regards', 'kind regards', 'yours')):
+        for i, is_closing in enumerate(closing):
+            if is_closing:
                 if i + 1 < len(lines):
                     applicant_name = lines[i + 1]
                     break
     
-    # Escape backslashes for Windows paths in JavaScript strings
-    output_path_escaped = output_path.replace('\\', '\\\\')
-    
-    # Generate Node.js script
-    script = f'''
-const {{ Document, Packer, Paragraph, TextRun, AlignmentType }} = require('docx');
-const fs = require('fs');
-
-// ATS-OPTIMIZED COVER LETTER TEMPLATE
-// Professional formatting suitable for ATS parsing
-
-const doc = new Document({{
-  styles: {{
-    default: {{
-      document: {{
-        run: {{ font: "Calibri", size: 22 }} // 11pt
-      }}
-    }},
-    paragraphStyles: [
-      {{
-        id: "ContactInfo",
-        name: "Contact Info",
-        basedOn: "Normal",
-        run: {{ size: 22, font: "Calibri" }},
-        paragraph: {{ spacing: {{ before: 0, after: 60 }} }}
-      }},
-      {{
-        id: "Date",
-        name: "Date",
-        basedOn: "Normal",
-        run: {{ size: 22, font: "Calibri" }},
-        paragraph: {{ spacing: {{ before: 120, after: 120 }} }}
-      }},
-      {{
-        id: "BodyParagraph",
-        name: "Body Paragraph",
-        basedOn: "Normal",
-        run: {{ size: 22, font: "Calibri" }},
-        paragraph: {{ spacing: {{ before: 0, after: 120 }} }}
-      }},
-      {{
-        id: "Closing",
-        name: "Closing",
-        basedOn: "Normal",
-        run: {{ size: 22, font: "Calibri" }},
-        paragraph: {{ spacing: {{ before: 120, after: 60 }} }}
-      }}
-    ]
-  }},
-  
-  sections: [{{
-    properties: {{
-      page: {{
-        margin: {{ top: 1440, right: 1440, bottom: 1440, left: 1440 }} // 1" margins
-      }}
-    }},
-    children: [
-'''
-    
-    # Add content paragraphs
+    # Classify paragraphs for the template
+    paragraphs = []
     in_closing = False
     
-    for line in lines:
-        line_escaped = line.replace('"', '\\"').replace("'", "\\'")
-        
+    for line, is_closing in zip(lines, closing):
         # Detect closing
-        if line.lower().startswith(('sincerely', 'best regards', 'kind regards', 'yours')):
+        if is_closing:
             in_closing = True
-            script += f'''
-      new Paragraph({{
-        style: "Closing",
-        children: [new TextRun("{line_escaped}")]
-      }}),
-'''
+            paragraphs.append({'type': 'closing', 'text': line})
         elif in_closing:
             # Signature line (name)
-            script += f'''
-      new Paragraph({{
-        style: "Closing",
-        children: [new TextRun({{ text: "{line_escaped}", bold: true }})]
-      }}),
-'''
+            paragraphs.append({'type': 'signature', 'text': line})
             in_closing = False
         else:
             # Regular paragraph
-            script += f'''
-      new Paragraph({{
-        style: "BodyParagraph",
-        children: [new TextRun("{line_escaped}")]
-      }}),
-'''
-    
-    # Close document
-    script += f'''
-    ]
-  }}]
-}});
-
-// Generate and save DOCX
-Packer.toBuffer(doc).then(buffer => {{
-  fs.writeFileSync("{output_path_escaped}", buffer);
-  console.log("✅ Cover letter DOCX generated successfully: {output_path_escaped}");
-}});
-'''
-    
-    # Save and execute script
-    script_path = Path(output_path).parent / "_generate_cover_letter.js"
-    with open(script_path, 'w', encoding='utf-8') as f:
-        f.write(script)
-    
-    import subprocess
-    result = subprocess.run(['node', str(script_path)], capture_output=True, text=True)
-    
-    if result.returncode != 0:
-        print(f"❌ Error generating cover letter DOCX:")
-        print(result.stderr)
-        raise RuntimeError(f"DOCX generation failed: {result.stderr}")
+            paragraphs.append({'type': 'body', 'text': line})
     
-    # Clean up
-    script_path.unlink()
+    payload = json.dumps({'paragraphs': paragraphs})
+    _render_docx('cover_letter', payload, output_path, 'cover letter')
     
     print(f"✅ ATS-optimized cover letter created: {output_path}")
 
@@ -0,0 +1,267 @@
+// DOCX RENDER WORKER for docx_templates.py
+// Reads one JSON job per line on stdin and writes one JSON result per line
+// on stdout, so a single Node process (with docx loaded once) serves every
+// document a Python process generates.
+//
+//   job:    { "kind": "cv" | "cover_letter", "data": {...}, "output": "path.docx" }
+//   result: { "ok": true, "path": "path.docx" } or { "ok": false, "error": "..." }
+
+const { Document, Packer, Paragraph, TextRun, AlignmentType, HeadingLevel, LevelFormat } = require('docx');
+const fs = require('fs');
+const readline = require('readline');
+
+// ATS-OPTIMIZED CV TEMPLATE
+// Uses simple formatting, standard fonts, clear hierarchy
+// NO tables, NO graphics, NO complex layouts
+function buildCv(data) {
+  const children = [
+    // NAME (Title style)
+    new Paragraph({
+      heading: HeadingLevel.TITLE,
+      children: [new TextRun(data.name)]
+    }),
+
+    // PROFESSIONAL TITLE (Subtitle style)
+    new Paragraph({
+      style: "Subtitle",
+      children: [new TextRun(data.title)]
+    })
+  ];
+
+  // CONTACT INFO (Contact style)
+  if (data.contact.length) {
+    children.push(new Paragraph({
+      style: "Contact",
+      children: [new TextRun(data.contact.join(" | "))]
+    }));
+  }
+
+  for (const section of data.sections) {
+    // Section header (H1) - ATS prefers uppercase section headers
+    children.push(new Paragraph({
+      heading: HeadingLevel.HEADING_1,
+      children: [new TextRun(section.title.toUpperCase())]
+    }));
+
+    for (const item of section.content) {
+      if (item.type === 'subsection') {
+        // Subsection title (H2) - job title, education
+        children.push(new Paragraph({
+          heading: HeadingLevel.HEADING_2,
+          children: [new TextRun(item.title)]
+        }));
+        for (const detail of item.details) {
+          children.push(cvParagraph(detail));
+        }
+      } else {
+        children.push(cvParagraph(item));
+      }
+    }
+  }
+
+  return new Document({
+    styles: {
+      default: {
+        document: {
+          run: { font: "Calibri", size: 22 } // 11pt body text
+        }
+      },
+      paragraphStyles: [
+        // Override built-in Title for name
+        {
+          id: "Title",
+          name: "Title",
+          basedOn: "Normal",
+          run: { size: 36, bold: true, color: "000000", font: "Calibri" }, // 18pt
+          paragraph: { spacing: { before: 0, after: 120 }, alignment: AlignmentType.CENTER }
+        },
+        // Override Heading1 for section headers
+        {
+          id: "Heading1",
+          name: "Heading 1",
+          basedOn: "Normal",
+          next: "Normal",
+          run: { size: 28, bold: true, color: "2E3B4E", font: "Calibri" }, // 14pt, dark gray
+          paragraph: {
+            spacing: { before: 240, after: 120 },
+            outlineLevel: 0,
+            border: { bottom: { color: "CCCCCC", space: 1, style: "single", size: 6 } } // Subtle line
+          }
+        },
+        // Override Heading2 for job titles/education
+        {
+          id: "Heading2",
+          name: "Heading 2",
+          basedOn: "Normal",
+          next: "Normal",
+          run: { size: 24, bold: true, color: "000000", font: "Calibri" }, // 12pt
+          paragraph: { spacing: { before: 180, after: 60 }, outlineLevel: 1 }
+        },
+        // Custom style for subtitle (professional title)
+        {
+          id: "Subtitle",
+          name: "Subtitle",
+          basedOn: "Normal",
+          run: { size: 24, color: "666666", font: "Calibri" }, // 12pt gray
+          paragraph: { spacing: { before: 60, after: 120 }, alignment: AlignmentType.CENTER }
+        },
+        // Custom style for contact info
+        {
+          id: "Contact",
+          name: "Contact",
+          basedOn: "Normal",
+          run: { size: 20, color: "666666", font: "Calibri" }, // 10pt gray
+          paragraph: { spacing: { before: 0, after: 240 }, alignment: AlignmentType.CENTER }
+        },
+        // Custom style for metadata (dates, locations)
+        {
+          id: "Metadata",
+          name: "Metadata",
+          basedOn: "Normal",
+          run: { size: 20, italics: true, color: "666666", font: "Calibri" }, // 10pt gray italic
+          paragraph: { spacing: { before: 0, after: 60 } }
+        }
+      ]
+    },
+
+    numbering: {
+      config: [
+        {
+          reference: "cv-bullets",
+          levels: [
+            {
+              level: 0,
+              format: LevelFormat.BULLET,
+              text: "•",
+              alignment: AlignmentType.LEFT,
+              style: {
+                paragraph: {
+                  indent: { left: 720, hanging: 360 } // Standard indent
+                }
+              }
+            }
+          ]
+        }
+      ]
+    },
+
+    sections: [{
+      properties: {
+        page: {
+          margin: { top: 1080, right: 1080, bottom: 1080, left: 1080 } // 0.75" margins
+        }
+      },
+      children
+    }]
+  });
+}
+
+// Bullet, metadata (dates, locations) or regular text line of a CV section
+function cvParagraph(item) {
+  if (item.type === 'bullet') {
+    return new Paragraph({
+      numbering: { reference: "cv-bullets", level: 0 },
+      children: [new TextRun(item.text)]
+    });
+  }
+  if (item.type === 'metadata') {
+    return new Paragraph({
+      style: "Metadata",
+      children: [new TextRun(item.text)]
+    });
+  }
+  return new Paragraph({
+    children: [new TextRun(item.text)]
+  });
+}
+
+// ATS-OPTIMIZED COVER LETTER TEMPLATE
+// Professional formatting suitable for ATS parsing
+function buildCoverLetter(data) {
+  const children = data.paragraphs.map(paragraph => {
+    if (paragraph.type === 'closing') {
+      return new Paragraph({
+        style: "Closing",
+        children: [new TextRun(paragraph.text)]
+      });
+    }
+    if (paragraph.type === 'signature') {
+      return new Paragraph({
+        style: "Closing",
+        children: [new TextRun({ text: paragraph.text, bold: true })]
+      });
+    }
+    return new Paragraph({
+      style: "BodyParagraph",
+      children: [new TextRun(paragraph.text)]
+    });
+  });
+
+  return new Document({
+    styles: {
+      default: {
+        document: {
+          run: { font: "Calibri", size: 22 } // 11pt
+        }
+      },
+      paragraphStyles: [
+        {
+          id: "ContactInfo",
+          name: "Contact Info",
+          basedOn: "Normal",
+          run: { size: 22, font: "Calibri" },
+          paragraph: { spacing: { before: 0, after: 60 } }
+        },
+        {
+          id: "Date",
+          name: "Date",
+          basedOn: "Normal",
+          run: { size: 22, font: "Calibri" },
+          paragraph: { spacing: { before: 120, after: 120 } }
+        },
+        {
+          id: "BodyParagraph",
+          name: "Body Paragraph",
+          basedOn: "Normal",
+          run: { size: 22, font: "Calibri" },
+          paragraph: { spacing: { before: 0, after: 120 } }
+        },
+        {
+          id: "Closing",
+          name: "Closing",
+          basedOn: "Normal",
+          run: { size: 22, font: "Calibri" },
+          paragraph: { spacing: { before: 120, after: 60 } }
+        }
+      ]
+    },
+
+    sections: [{
+      properties: {
+        page: {
+          margin: { top: 1440, right: 1440, bottom: 1440, left: 1440 } // 1" margins
+        }
+      },
+      children
+    }]
+  });
+}
+
+const builders = { cv: buildCv, cover_letter: buildCoverLetter };
+
+async function render(line) {
+  const job = JSON.parse(line);
+  const buffer = await Packer.toBuffer(builders[job.kind](job.data));
+  fs.writeFileSync(job.output, buffer);
+  return { ok: true, path: job.output };
+}
+
+// Jobs are rendered one at a time so results come back in request order
+let queue = Promise.resolve();
+
+readline.createInterface({ input: process.stdin }).on('line', line => {
+  queue = queue
+    .then(() => render(line))
+    .catch(error => ({ ok: false, error: String(error && error.stack || error) }))
+    .then(result => process.stdout.write(JSON.stringify(result) + '\n'));
+});
@@ -8,7 +8,7 @@ Used by document_parser.py for rule-based NLP.
 # =============================================================================
 # HARD SKILLS (Technical skills, tools, technologies)
 # =============================================================================
-HARD_SKILLS = {
+HARD_SKILLS = frozenset({
     # Programming Languages
     "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go",
     "golang", "rust", "scala", "kotlin", "swift", "php", "perl", "r",
@@ -114,12 +114,12 @@ HARD_SKILLS = {
     "virtualization", "vmware", "hyper-v", "embedded systems",
     "iot", "blockchain", "smart contracts", "solidity", "web3",
     "ar", "vr", "unity", "unreal engine", "game development",
-}
+})
 
 # =============================================================================
 # SOFT SKILLS (Interpersonal and professional skills)
 # =============================================================================
-SOFT_SKILLS = {
+SOFT_SKILLS = frozenset({
     # Communication
     "communication", "written communication", "verbal communication",
     "presentation", "public speaking", "storytelling", "documentation",
@@ -162,12 +162,12 @@ SOFT_SKILLS = {
     "professionalism", "integrity", "ethics", "reliability",
     "dependability", "emotional intelligence", "cultural awareness",
     "diversity", "inclusion", "empathy", "patience",
-}
+})
 
 # =============================================================================
 # CERTIFICATIONS (Professional certifications)
 # =============================================================================
-CERTIFICATIONS = {
+CERTIFICATIONS = frozenset({
     # Cloud Certifications
     "aws certified", "aws solutions architect", "aws developer",
     "aws sysops", "aws devops", "aws machine learning",
@@ -207,12 +207,12 @@ CERTIFICATIONS = {
     # Other
     "itil", "togaf", "cobit", "iso 27001", "soc 2",
     "gdpr certified", "hipaa certified",
-}
+})
 
 # =============================================================================
 # METHODOLOGIES (Development and business methodologies)
 # =============================================================================
-METHODOLOGIES = {
+METHODOLOGIES = frozenset({
     # Agile
     "agile", "scrum", "kanban", "lean", "xp", "extreme programming",
     "safe", "scaled agile", "less", "nexus", "spotify model",
@@ -246,12 +246,12 @@ METHODOLOGIES = {
     # Design
     "design thinking", "user-centered design", "human-centered design",
     "design sprint", "rapid prototyping",
-}
+})
 
 # =============================================================================
 # DOMAINS (Industry domains and business areas)
 # =============================================================================
-DOMAINS = {
+DOMAINS = frozenset({
     # Finance
     "fintech", "banking", "financial services", "investment banking",
     "asset management", "wealth management", "insurance", "insurtech",
@@ -289,7 +289,7 @@ DOMAINS = {
     "travel", "hospitality", "food tech", "agriculture", "agtech",
     "telecommunications", "telecom", "legal tech", "hr tech",
     "non-profit", "ngo", "consulting",
-}
+})
 
 # =============================================================================
 # JOB TITLE PATTERNS (Regex patterns for detecting job titles)
@@ -342,7 +342,7 @@ YEARS_EXPERIENCE_PATTERNS = [
 # =============================================================================
 # ACTION VERBS (For evidence strength scoring)
 # =============================================================================
-ACTION_VERBS = {
+ACTION_VERBS = frozenset({
     # Leadership
     "led", "managed", "directed", "supervised", "coordinated", "oversaw",
     "headed", "spearheaded", "orchestrated", "mentored", "coached",
@@ -372,7 +372,7 @@ ACTION_VERBS = {
     # Other
     "drove", "executed", "performed", "conducted", "maintained",
     "supported", "contributed", "participated", "assisted",
-}
+})
 
 # =============================================================================
 # METRIC PATTERNS (For detecting quantified achievements)
@@ -388,11 +388,15 @@ METRIC_PATTERNS = [
 ]
 
 
-def get_all_skills() -> set:
+# Every entity term, built once for membership checks across all taxonomies
+ALL_ENTITIES = HARD_SKILLS | SOFT_SKILLS | CERTIFICATIONS | METHODOLOGIES | DOMAINS
+
+
+def get_all_skills() -> frozenset:
     """Return combined set of hard and soft skills."""
     return HARD_SKILLS | SOFT_SKILLS
 
 
-def get_all_entities() -> set:
+def get_all_entities() -> frozenset:
     """Return all entity terms for matching."""
-    return HARD_SKILLS | SOFT_SKILLS | CERTIFICATIONS | METHODOLOGIES | DOMAINS
+    return ALL_ENTITIES
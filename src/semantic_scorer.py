@@ -6,6 +6,7 @@ Enables matching skills by meaning, not just exact keywords.
 """
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Optional, Any
 from functools import lru_cache
@@ -64,34 +65,39 @@ class EmbeddingCache:
         self.maxsize = maxsize
         self._cache: dict[str, Any] = {}
         self._access_order: list[str] = []
+        # The scorer is shared across threads (see ats_optimizer)
+        self._lock = threading.Lock()
 
     def get(self, text: str) -> Optional[Any]:
         """Get cached embedding if available."""
         normalized = text.strip().lower()
-        if normalized in self._cache:
-            # Move to end (most recently used)
-            if normalized in self._access_order:
-                self._access_order.remove(normalized)
-            self._access_order.append(normalized)
-            return self._cache[normalized]
+        with self._lock:
+            if normalized in self._cache:
+                # Move to end (most recently used)
+                if normalized in self._access_order:
+                    self._access_order.remove(normalized)
+                self._access_order.append(normalized)
+                return self._cache[normalized]
         return None
 
     def put(self, text: str, embedding: Any) -> None:
         """Cache an embedding."""
         normalized = text.strip().lower()
 
-        # Evict oldest if at capacity
-        while len(self._cache) >= self.maxsize and self._access_order:
-            oldest = self._access_order.pop(0)
-            self._cache.pop(oldest, None)
+        with self._lock:
+            # Evict oldest if at capacity
+            while len(self._cache) >= self.maxsize and self._access_order:
+                oldest = self._access_order.pop(0)
+                self._cache.pop(oldest, None)
 
-        self._cache[normalized] = embedding
-        self._access_order.append(normalized)
+            self._cache[normalized] = embedding
+            self._access_order.append(normalized)
 
     def clear(self) -> None:
         """Clear the cache."""
-        self._cache.clear()
-        self._access_order.clear()
+        with self._lock:
+            self._cache.clear()
+            self._access_order.clear()
 
     def __len__(self) -> int:
         return len(self._cache)
@@ -129,6 +135,7 @@ class SemanticScorer:
         self._model = None
         self._cache = EmbeddingCache(maxsize=cache_size)
         self._model_loaded = False
+        self._load_lock = threading.Lock()
 
     @classmethod
     def is_available(cls) -> bool:
@@ -140,21 +147,27 @@ class SemanticScorer:
         if self._model_loaded:
             return self._model is not None
 
-        self._model_loaded = True
+        # Concurrent first callers wait for one load instead of seeing no model
+        with self._load_lock:
+            if not self._model_loaded:
+                self._model = self._create_model()
+                self._model_loaded = True
+        return self._model is not None
 
+    def _create_model(self) -> Optional[Any]:
+        """Load the embedding model, or return None if it is unavailable."""
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             logger.warning("sentence-transformers not installed. Semantic scoring unavailable.")
-            return False
+            return None
 
         try:
             logger.info(f"Loading embedding model: {self.MODEL_NAME}")
-            self._model = SentenceTransformer(self.MODEL_NAME)
+            model = SentenceTransformer(self.MODEL_NAME)
             logger.info("Embedding model loaded successfully.")
-            return True
+            return model
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
-            self._model = None
-            return False
+            return None
 
     def embed_text(self, text: str) -> Optional[Any]:
         """
@@ -212,6 +225,25 @@ class SemanticScorer:
 
         return results
 
+    def embed_document(self, text: str, chunk_words: int = 150) -> Optional[Any]:
+        """
+        Embed a long text as the mean of its word-chunk embeddings.
+        The model truncates input at 256 word pieces, so embedding a whole
+        job description with embed_text() would only see its opening lines.
+        """
+        words = text.split()
+        if not words:
+            return None
+
+        chunks = [
+            " ".join(words[i:i + chunk_words])
+            for i in range(0, len(words), chunk_words)
+        ]
+        embeddings = [e for e in self.embed_batch(chunks) if e is not None]
+        if not embeddings:
+            return None
+        return np.mean(embeddings, axis=0)
+
     @staticmethod
     def cosine_similarity(a: Any, b: Any) -> float:
         """Calculate cosine similarity between two vectors."""
@@ -0,0 +1,245 @@
+"""Unit tests for ATSOptimizer keyword extraction and requirement caching."""
+import threading
+
+import numpy as np
+import pytest
+
+from ats_optimizer import ATSOptimizer, RequirementsCache
+from document_parser import Entity, EntityType, ParsedCV, ParsedJD
+from llm_backend import LLMBackend
+
+
+class FakeBackend(LLMBackend):
+    """Records chat calls and returns a fixed requirements block."""
+
+    def __init__(self, name: str = "Fake (test)"):
+        self.name = name
+        self.calls = 0
+
+    def chat(self, messages, **kwargs) -> str:
+        self.calls += 1
+        return "Sure, here you go:\nTOOLS: Python, AWS\nMETHODOLOGIES: Agile"
+
+    def get_backend_name(self) -> str:
+        return self.name
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_caches():
+    ATSOptimizer._requirements_cache.clear()
+    ATSOptimizer._keywords_cache.clear()
+    ATSOptimizer._score_cache.clear()
+    ATSOptimizer._parsed_cache.clear()
+    yield
+    ATSOptimizer._requirements_cache.clear()
+    ATSOptimizer._keywords_cache.clear()
+    ATSOptimizer._score_cache.clear()
+    ATSOptimizer._parsed_cache.clear()
+
+
+def test_identify_key_requirements_cached_across_instances():
+    backend = FakeBackend()
+    jd = "Senior engineer with Python and AWS experience."
+
+    first = ATSOptimizer(backend=backend).identify_key_requirements(jd)
+    second = ATSOptimizer(backend=backend).identify_key_requirements(jd)
+
+    assert first == second
+    assert first.startswith("TOOLS:")
+    assert backend.calls == 1
+
+
+def test_identify_key_requirements_cache_is_per_backend():
+    jd = "Senior engineer with Python and AWS experience."
+    ollama, gemini = FakeBackend("Ollama (a)"), FakeBackend("Gemini (b)")
+
+    ATSOptimizer(backend=ollama).identify_key_requirements(jd)
+    ATSOptimizer(backend=gemini).identify_key_requirements(jd)
+
+    assert ollama.calls == 1
+    assert gemini.calls == 1
+
+
+def test_requirements_cache_similarity_threshold():
+    cache = RequirementsCache(threshold=0.95)
+    cache.put("b", "original posting", np.array([1.0, 0.0, 0.0]), "TOOLS: x")
+
+    assert cache.get_similar("b", np.array([0.99, 0.05, 0.0])) == "TOOLS: x"
+    assert cache.get_similar("b", np.array([0.5, 0.5, 0.0])) is None
+    assert cache.get_similar("other", np.array([1.0, 0.0, 0.0])) is None
+
+
+def test_requirements_cache_evicts_least_recently_used():
+    cache = RequirementsCache(maxsize=2)
+    cache.put("b", "one", None, "1")
+    cache.put("b", "two", None, "2")
+    assert cache.get_exact("b", "one") == "1"
+    cache.put("b", "three", None, "3")
+
+    assert cache.get_exact("b", "two") is None
+    assert cache.get_exact("b", "one") == "1"
+    assert len(cache) == 2
+
+
+class BatchBackend(FakeBackend):
+    """Answers batched prompts with one block per JD, omitting JD 2."""
+
+    def chat(self, messages, **kwargs) -> str:
+        self.calls += 1
+        prompt = messages[-1]["content"]
+        if "Job descriptions:" not in prompt:
+            return "TOOLS: Fallback"
+        return (
+            "=== JD 1 ===\nTOOLS: Python\nMETHODOLOGIES: Agile\n\n"
+            "=== JD 3 ===\nTOOLS: Excel\n"
+        )
+
+
+def test_identify_key_requirements_batch_packs_misses_and_falls_back():
+    backend = FakeBackend()
+    optimizer = ATSOptimizer(backend=backend)
+    optimizer.identify_key_requirements("Already seen posting.")
+
+    batch_backend = BatchBackend(backend.name)
+    optimizer = ATSOptimizer(backend=batch_backend)
+    results = optimizer.identify_key_requirements_batch([
+        "Python role.", "Already seen posting.", "Java role.", "Excel role.", "Python role.",
+    ])
+
+    assert results[0] == results[4] == "TOOLS: Python\nMETHODOLOGIES: Agile"
+    assert results[1].startswith("TOOLS: Python, AWS")
+    assert results[2] == "TOOLS: Fallback"
+    assert results[3] == "TOOLS: Excel"
+    # One batched call for the three distinct misses, one fallback for JD 2
+    assert batch_backend.calls == 2
+    assert optimizer.identify_key_requirements("Excel role.") == "TOOLS: Excel"
+    assert batch_backend.calls == 2
+
+
+def test_section_match_prefers_experience_then_projects_then_skills():
+    def skill(text, section=None):
+        return Entity(text=text, entity_type=EntityType.HARD_SKILL, section=section)
+
+    parsed_cv = ParsedCV(raw_text="", entities=[
+        skill("Python", "skills"), skill("python", "experience"),
+        skill("SQL", "skills"), skill("SQL", "projects"),
+        skill("Excel", "skills"),
+        skill("Jira", "education"), skill("Git"),
+    ])
+    parsed_jd = ParsedJD(raw_text="", required_entities=[
+        skill(name) for name in ("Python", "SQL", "Excel", "Jira", "Git", "Rust")
+    ])
+
+    matches = ATSOptimizer(backend=FakeBackend())._calculate_section_match(parsed_cv, parsed_jd)
+
+    assert matches['experience_matches'] == ['python']
+    assert matches['projects_matches'] == ['sql']
+    assert matches['skills_matches'] == ['excel']
+    assert sorted(matches['other_matches']) == ['git', 'jira']
+    assert matches['not_found'] == ['rust']
+
+
+def test_optimizers_share_document_parser_and_semantic_scorer():
+    first = ATSOptimizer(backend=FakeBackend())
+    second = ATSOptimizer(backend=FakeBackend(), company_name="Acme")
+
+    assert first.document_parser is second.document_parser
+    assert first.semantic_scorer is second.semantic_scorer
+
+
+def test_extract_keywords_cache_is_keyed_by_stopwords_and_copied():
+    jd = "Acme seeks a Python engineer. Python and Kubernetes at Acme."
+
+    plain = ATSOptimizer(backend=FakeBackend()).extract_keywords(jd, auto_detect_company=False)
+    plain['unigrams']['python'] += 100
+    again = ATSOptimizer(backend=FakeBackend()).extract_keywords(jd, auto_detect_company=False)
+    with_company = ATSOptimizer(backend=FakeBackend(), company_name="Acme").extract_keywords(jd)
+
+    assert again['unigrams']['python'] == 2
+    assert 'acme' in again['unigrams']
+    assert 'acme' not in with_company['unigrams']
+    assert len(ATSOptimizer._keywords_cache) == 2
+
+
+def test_extract_keywords_multiword_company_keeps_unigrams():
+    healthcare = ATSOptimizer(backend=FakeBackend(), company_name="GE Healthcare").extract_keywords(
+        "GE Healthcare is hiring. ge healthcare python developers.", auto_detect_company=False
+    )
+    foods = ATSOptimizer(backend=FakeBackend(), company_name="AB Foods").extract_keywords(
+        "ab foods ab foods ab python", auto_detect_company=False
+    )
+
+    # Only whole-token stopwords drop unigrams; "ge"/"ab" are too short to be added
+    assert healthcare['unigrams']['ge'] == 2
+    assert 'healthcare' not in healthcare['unigrams']
+    assert foods['unigrams']['ab'] == 3
+    assert foods['bigrams']['ab foods'] == 2
+
+
+def test_calculate_ats_score_cached_on_inputs(monkeypatch):
+    cv = "Experience\nBuilt Python services on AWS for five years."
+    jd = "Requirements\nPython and AWS experience required."
+    requirements = "TOOLS: Python, AWS, Terraform"
+    optimizer = ATSOptimizer(backend=FakeBackend())
+
+    first = optimizer.calculate_ats_score(cv, jd, requirements)
+    first['matched_keywords'].append('tampered')
+
+    def fail(*args, **kwargs):
+        raise AssertionError("scoring pipeline re-ran on a cache hit")
+
+    monkeypatch.setattr(optimizer, "_score_documents", fail)
+    second = optimizer.calculate_ats_score(cv, jd, requirements)
+
+    assert 'tampered' not in second['matched_keywords']
+    assert second['scores_by_category']['tools']['missing'] == 1
+    with pytest.raises(AssertionError):
+        optimizer.calculate_ats_score(cv, jd, "TOOLS: Python")
+
+
+class ThreadRecordingScorer:
+    def __init__(self):
+        self.thread = None
+
+    def is_available(self):
+        return True
+
+    def calculate_semantic_score(self, parsed_cv, parsed_jd):
+        self.thread = threading.get_ident()
+        return "semantic"
+
+
+def test_analyze_documents_scores_semantics_off_thread():
+    optimizer = ATSOptimizer(backend=FakeBackend())
+    optimizer.semantic_scorer = ThreadRecordingScorer()
+
+    analysis = optimizer._analyze_documents(
+        "Experience\nBuilt Python services at Acme.",
+        "Acme is hiring.\nRequirements\nPython experience required.",
+    )
+
+    assert analysis['semantic_result'] == "semantic"
+    assert optimizer.semantic_scorer.thread != threading.get_ident()
+    assert set(analysis) == {
+        'parsed_cv', 'parsed_jd', 'section_matches', 'evidence_scores',
+        'semantic_result', 'job_keywords', 'cv_keywords',
+    }
+
+
+def test_parsed_documents_reused_across_jobs(monkeypatch):
+    cv = "Experience\nBuilt Python services on AWS for five years."
+    optimizer = ATSOptimizer(backend=FakeBackend())
+    calls = []
+    original = optimizer.document_parser.parse_cv
+
+    def counting_parse_cv(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(optimizer.document_parser, "parse_cv", counting_parse_cv)
+    first = optimizer._analyze_documents(cv, "Requirements\nPython required.")
+    first['parsed_cv'].entities.clear()
+    second = optimizer._analyze_documents(cv, "Requirements\nAWS and Terraform required.")
+
+    assert calls == [cv]
+    assert second['parsed_cv'].entities
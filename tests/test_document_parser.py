@@ -0,0 +1,16 @@
+"""Unit tests for DocumentParser entity extraction."""
+from document_parser import EntityExtractor, EntityType
+
+
+def test_extract_entities_finds_nested_and_repeated_terms():
+    extractor = EntityExtractor()
+    text = "Tuned SQL Server and sql queries; later moved from Ruby on Rails to Ruby."
+
+    entities = {(e.text, e.entity_type) for e in extractor.extract_entities(text)}
+
+    # "sql" is reported at its first match, inside "SQL Server"
+    assert ("SQL", EntityType.HARD_SKILL) in entities
+    assert ("SQL Server", EntityType.HARD_SKILL) in entities
+    assert ("Ruby on Rails", EntityType.HARD_SKILL) in entities
+    assert ("Ruby", EntityType.HARD_SKILL) in entities
+    assert not any(text == "sql" for text, _ in entities)
@@ -0,0 +1,26 @@
+"""Unit tests for DOCX template data preparation."""
+import json
+
+import docx_templates
+
+
+def test_cv_payload_parses_each_markdown_once(monkeypatch):
+    docx_templates._cv_payload_cache.clear()
+    calls = []
+    original = docx_templates.parse_markdown_cv
+
+    def counting_parse(md_content):
+        calls.append(md_content)
+        return original(md_content)
+
+    monkeypatch.setattr(docx_templates, "parse_markdown_cv", counting_parse)
+    cv = '# Jane Doe\n**Engineer**\n## Skills\n- Python "3"\n'
+
+    first = docx_templates._cv_payload(cv)
+    second = docx_templates._cv_payload(cv)
+    docx_templates._cv_payload(cv + "- AWS\n")
+
+    assert first is second
+    assert len(calls) == 2
+    assert json.loads(first)['sections'][0]['content'] == [{'type': 'bullet', 'text': 'Python "3"'}]
+    docx_templates._cv_payload_cache.clear()
@@ -1,4 +1,5 @@
 """Unit tests for JobStore CRUD operations."""
+import json
 
 
 def test_create_job(job_store):
@@ -52,3 +53,23 @@ def test_delete_job(job_store):
     job_store.create_job("test-007", user_id="alice")
     job_store.delete_job("test-007", user_id="alice")
     assert job_store.get_job("test-007") is None
+
+
+def test_position_profile_aggregates_ats_details(job_store):
+    details = json.dumps({
+        "parsed_entities": {"jd_required_skills": ["Python", "AWS"]},
+        "matched_keywords": ["python"],
+        "missing_keywords": ["aws"],
+    })
+    for i in range(2):
+        job_store.create_job(f"test-pp-{i}", user_id="dave")
+        job_store.update_job(f"test-pp-{i}", job_title="Engineer", ats_details=details)
+    job_store.create_job("test-pp-bad", user_id="dave")
+    job_store.update_job("test-pp-bad", ats_details="not json")
+
+    profile = job_store.get_position_profile(user_id="dave")
+    assert profile["job_count"] == 2
+    skills = {s["skill"]: s for s in profile["skill_frequency"]}
+    assert skills["python"]["match_rate"] == 1.0
+    assert skills["aws"]["matched_count"] == 0
+    assert profile["role_distribution"][0]["count"] == 2